@@ -1,13 +1,14 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 from argparse import ArgumentParser, Namespace, _SubParsersAction
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Literal
+from typing import AbstractSet, Any, Callable, Literal
 import json
 import yaml
 import os
+import sys
 
 from ._job_from_template import (
     job_from_template,
@@ -15,6 +16,7 @@ from ._job_from_template import (
     get_params_from_file,
 )
 from ._validation_utils import (
+    YamlSafeDumper,
     get_doc_type,
     read_template,
     read_job_template,
@@ -44,7 +46,7 @@ class CommonArgument(Enum):
 
 
 def add_common_arguments(
-    parser: ArgumentParser, common_arg_options: set[CommonArgument] = set()
+    parser: ArgumentParser, common_arg_options: AbstractSet[CommonArgument] = frozenset()
 ) -> None:
     """
     Adds arguments that are used across commands.
@@ -127,7 +129,7 @@ def generate_job(args: Namespace) -> Job:
 
 
 @dataclass
-class OpenJDCliResult(BaseException):
+class OpenJDCliResult:
     """
     Denotes the result of a command, including its status (success/error)
     and an accompanying message.
@@ -143,12 +145,24 @@ class OpenJDCliResult(BaseException):
         return self.message
 
 
-def _asdict_omit_null(attrs: list) -> dict:
+def _asdict_omit_null(obj: Any) -> Any:
     """
     Retrieves a dataclass' attributes in a dictionary, omitting any fields with None or empty values.
+    Nested dataclasses, lists, and dictionaries are converted recursively. Unlike `dataclasses.asdict`,
+    leaf values are not deep-copied since the result is only used for serialization.
     """
 
-    return {attr: value for (attr, value) in attrs if value}
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            field.name: _asdict_omit_null(value)
+            for field in fields(obj)
+            if (value := getattr(obj, field.name))
+        }
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_asdict_omit_null(item) for item in obj)
+    if isinstance(obj, dict):
+        return {key: _asdict_omit_null(value) for key, value in obj.items()}
+    return obj
 
 
 def print_cli_result(command: Callable[[Namespace], OpenJDCliResult]) -> Callable:
@@ -161,16 +175,18 @@ def print_cli_result(command: Callable[[Namespace], OpenJDCliResult]) -> Callabl
         response = command(args)
 
         if args.output == "human-readable":
-            print(str(response))
+            output = str(response)
+        elif args.output == "json":
+            output = json.dumps(_asdict_omit_null(response), indent=4)
         else:
-            if args.output == "json":
-                print(json.dumps(asdict(response, dict_factory=_asdict_omit_null), indent=4))
-            else:
-                print(
-                    yaml.safe_dump(
-                        asdict(response, dict_factory=_asdict_omit_null), sort_keys=False
-                    )
-                )
+            output = yaml.dump(
+                _asdict_omit_null(response),
+                Dumper=YamlSafeDumper,
+                sort_keys=False,
+            )
+
+        # Emit the result and its trailing newline in a single write
+        sys.stdout.write(f"{output}\n")
 
         if response.status == "error":
             raise SystemExit(1)
@@ -3,20 +3,20 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-import re
 from typing import Union
 import yaml
 
-from ._validation_utils import get_doc_type
+from ._validation_utils import NotARegularFileError, load_document
 from openjd.model import (
     DecodeValidationError,
-    DocumentType,
     Job,
     JobTemplate,
     create_job,
     preprocess_job_parameters,
 )
 
+_FILE_PREFIX = "file://"
+
 
 def get_params_from_file(parameter_string: str) -> Union[dict, list]:
     """
@@ -24,35 +24,22 @@ def get_params_from_file(parameter_string: str) -> Union[dict, list]:
 
     Raises: RuntimeError if the file can't be opened
     """
-    parameter_file = Path(parameter_string.removeprefix("file://")).expanduser()
+    parameter_file = Path(parameter_string.removeprefix(_FILE_PREFIX)).expanduser()
 
-    if not parameter_file.exists():
+    try:
+        # Raises: OSError, RuntimeError, ValueError, YAMLError
+        return load_document(parameter_file)
+    except (FileNotFoundError, NotADirectoryError):
         raise RuntimeError(f"Provided parameter file '{str(parameter_file)}' does not exist.")
-    if not parameter_file.is_file():
+    except NotARegularFileError:
         raise RuntimeError(f"Provided parameter file '{str(parameter_file)}' is not a file.")
-
-    # Raises: RuntimeError
-    doc_type = get_doc_type(parameter_file)
-
-    try:
-        parameter_string = parameter_file.read_text()
     except OSError:
         raise RuntimeError(f"Could not open parameter file '{str(parameter_file)}'.")
-
-    try:
-        if doc_type == DocumentType.YAML:
-            # Raises: YAMLError
-            parameters = yaml.safe_load(parameter_string)
-        else:
-            # Raises: JSONDecodeError
-            parameters = json.loads(parameter_string)
-    except (yaml.YAMLError, json.JSONDecodeError) as exc:
+    except (yaml.YAMLError, ValueError) as exc:
         raise RuntimeError(
             f"Parameter file '{str(parameter_file)}' is formatted incorrectly: {str(exc)}"
         )
 
-    return parameters
-
 
 def get_job_params(parameter_args: list[str]) -> dict:
     """
@@ -65,7 +52,7 @@ def get_job_params(parameter_args: list[str]) -> dict:
     for arg in parameter_args:
         arg = arg.strip()
         # Case 1: Provided argument is a filepath
-        if arg.startswith("file://"):
+        if arg.startswith(_FILE_PREFIX):
             # Raises: RuntimeError
             parameters = get_params_from_file(arg)
 
@@ -75,7 +62,7 @@ def get_job_params(parameter_args: list[str]) -> dict:
                 raise RuntimeError(f"Job parameter file '{arg}' should contain a dictionary.")
 
         # Case 2: Provided as a JSON string
-        elif re.match("^{(.*)}$", arg):
+        elif arg.startswith("{") and arg.endswith("}"):
             try:
                 # Raises: JSONDecodeError
                 parameters = json.loads(arg)
@@ -91,13 +78,13 @@ def get_job_params(parameter_args: list[str]) -> dict:
             parameter_dict.update(parameters)
 
         # Case 3: Provided argument is a Key=Value string
-        elif regex_match := re.match("^([^=]+)=(.*)$", arg):
-            parameter_dict.update({regex_match[1]: regex_match[2]})
-
         else:
-            raise RuntimeError(
-                f"Job parameter string ('{arg}') not formatted correctly. It must be key=value pairs, inline JSON, or a path to a JSON or YAML document prefixed with 'file://'."
-            )
+            key, separator, value = arg.partition("=")
+            if not key or not separator:
+                raise RuntimeError(
+                    f"Job parameter string ('{arg}') not formatted correctly. It must be key=value pairs, inline JSON, or a path to a JSON or YAML document prefixed with 'file://'."
+                )
+            parameter_dict[key] = value
 
     return parameter_dict
 
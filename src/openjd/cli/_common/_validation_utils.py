@@ -2,24 +2,68 @@
 
 from typing import Any
 from pathlib import Path
+import json
+import os
+import yaml
+from stat import S_ISREG
 
 from openjd.model import (
-    DecodeValidationError,
     DocumentType,
     EnvironmentTemplate,
     JobTemplate,
-    document_string_to_object,
     decode_environment_template,
     decode_job_template,
 )
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it;
+# the pure-Python implementations are much slower on large documents.
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlSafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+_DOC_TYPE_BY_SUFFIX: dict[str, DocumentType] = {
+    ".json": DocumentType.JSON,
+    ".yaml": DocumentType.YAML,
+    ".yml": DocumentType.YAML,
+}
+
 
 def get_doc_type(filepath: Path) -> DocumentType:
-    if filepath.suffix.lower() == ".json":
-        return DocumentType.JSON
-    elif filepath.suffix.lower() in (".yaml", ".yml"):
-        return DocumentType.YAML
-    raise RuntimeError(f"'{str(filepath)}' is not JSON or YAML.")
+    doc_type = _DOC_TYPE_BY_SUFFIX.get(filepath.suffix.lower())
+    if doc_type is None:
+        raise RuntimeError(f"'{str(filepath)}' is not JSON or YAML.")
+    return doc_type
+
+
+class NotARegularFileError(OSError):
+    """Raised by `load_document` when the path exists but is not a regular file."""
+
+
+def load_document(document_file: Path) -> Any:
+    """
+    Parses a JSON or YAML file, chosen by its suffix, into plain Python objects.
+    The document is parsed directly from a binary file object.
+
+    Raises:
+        FileNotFoundError, NotADirectoryError: if the path does not exist
+        NotARegularFileError: if the path is not a regular file
+        RuntimeError: if the file is not JSON or YAML
+        OSError: if the file can't be read
+        ValueError, YAMLError: if the file can't be parsed
+    """
+    # A single stat() call answers whether the file exists and whether it's a regular file.
+    if not S_ISREG(os.stat(document_file).st_mode):
+        raise NotARegularFileError(f"'{str(document_file)}' is not a file.")
+
+    # Raises: RuntimeError
+    document_type = get_doc_type(document_file)
+
+    with open(document_file, "rb") as document_stream:
+        if document_type == DocumentType.JSON:
+            # Raises: JSONDecodeError, UnicodeDecodeError
+            return json.load(document_stream)
+        # Raises: YAMLError
+        return yaml.load(document_stream, Loader=YamlSafeLoader)
 
 
 def read_template(template_file: Path) -> dict[str, Any]:
@@ -27,28 +71,23 @@ def read_template(template_file: Path) -> dict[str, Any]:
     Raises a RuntimeError if the file doesn't exist or can't be opened, and raises a
     DecodeValidationError if its contents can't be parsed into a valid JobTemplate.
     """
-
-    if not template_file.exists():
-        raise RuntimeError(f"'{str(template_file)}' does not exist.")
-
-    if template_file.is_file():
-        # Raises: RuntimeError
-        filetype = get_doc_type(template_file)
-    else:
-        raise RuntimeError(f"'{str(template_file)}' is not a file.")
-
     try:
-        template_string = template_file.read_text(encoding="utf-8")
+        # Raises: OSError, RuntimeError, ValueError, YAMLError
+        template_object = load_document(template_file)
+    except (FileNotFoundError, NotADirectoryError):
+        raise RuntimeError(f"'{str(template_file)}' does not exist.")
+    except NotARegularFileError as exc:
+        raise RuntimeError(str(exc))
     except OSError as exc:
         raise RuntimeError(f"Could not open file '{str(template_file)}': {str(exc)}")
+    except (ValueError, yaml.YAMLError):
+        template_object = None
 
-    try:
-        # Raises: DecodeValidationError
-        template_object = document_string_to_object(
-            document=template_string, document_type=filetype
+    if not isinstance(template_object, dict):
+        raise RuntimeError(
+            f"'{str(template_file)}' failed checks: The document is not a valid"
+            f" {get_doc_type(template_file).value} document consisting of key-value pairs."
         )
-    except DecodeValidationError as exc:
-        raise RuntimeError(f"'{str(template_file)}' failed checks: {str(exc)}")
 
     return template_object
 
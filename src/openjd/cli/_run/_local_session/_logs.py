@@ -25,11 +25,12 @@ class LocalSessionLogHandler(Handler):
     them in memory.
     """
 
-    messages: list[LogEntry] = []
+    messages: list[LogEntry]
     _should_print: bool
 
     def __init__(self, should_print: bool):
         super(LocalSessionLogHandler, self).__init__()
+        self.messages = []
         self._should_print = should_print
 
     def handle(self, record: LogRecord) -> bool:
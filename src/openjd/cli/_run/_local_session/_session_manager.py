@@ -1,11 +1,12 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
-from queue import Queue
-from threading import Event
+from collections import deque
+from itertools import islice
+from threading import Event, current_thread, main_thread
 import time
-from typing import Optional, Type
+from typing import Any, Callable, Iterable, Optional, Type, Union
 from types import FrameType, TracebackType
-from signal import signal, SIGINT, SIGTERM, SIG_DFL
+from signal import signal, Signals, SIGINT, SIGTERM, SIG_DFL
 
 from ._actions import EnterEnvironmentAction, ExitEnvironmentAction, RunTaskAction, SessionAction
 from ._logs import LocalSessionLogHandler, LogEntry
@@ -29,6 +30,8 @@ from openjd.sessions import (
     PathMappingRule,
 )
 
+_SignalHandler = Union[Callable[[int, Optional[FrameType]], Any], int, None]
+
 
 class LocalSession:
     """
@@ -43,16 +46,17 @@ class LocalSession:
     tasks_run: int = 0
     _job: Job
     _maximum_tasks: int
-    _start_seconds: float
-    _end_seconds: float
+    _start_ns: Optional[int]
+    _end_ns: Optional[int]
     _inner_session: Session
-    _action_queue: Queue[SessionAction]
+    _action_queue: deque[SessionAction]
     _current_action: Optional[SessionAction]
     _action_ended: Event
     _path_mapping_rules: Optional[list[PathMappingRule]]
     _environments: Optional[list[EnvironmentTemplate]]
     _log_handler: LocalSessionLogHandler
     _cleanup_called: bool
+    _previous_signal_handlers: dict[Signals, _SignalHandler]
 
     def __init__(
         self,
@@ -72,14 +76,10 @@ class LocalSession:
         self._environments = environments
 
         # Create an inner Session
-        job_parameters: JobParameterValues
-        if job.parameters:
-            job_parameters = {
-                name: ParameterValue(type=ParameterValueType(param.type.value), value=param.value)
-                for name, param in job.parameters.items()
-            }
-        else:
-            job_parameters = dict[str, ParameterValue]()
+        job_parameters: JobParameterValues = {
+            name: ParameterValue(type=ParameterValueType(param.type.value), value=param.value)
+            for name, param in (job.parameters or {}).items()
+        }
 
         self._inner_session = Session(
             session_id=self.session_id,
@@ -89,9 +89,12 @@ class LocalSession:
             retain_working_dir=retain_working_dir,
         )
 
-        # Initialize the action queue
-        self._action_queue: Queue[SessionAction] = Queue()
+        # Initialize the action queue. Actions are only enqueued and dequeued by the thread
+        # that calls `initialize` and `run`, so no locking is needed.
+        self._action_queue: deque[SessionAction] = deque()
         self._current_action = None
+        self._start_ns = None
+        self._end_ns = None
 
         self._should_print_logs = should_print_logs
         self._cleanup_called = False
@@ -100,8 +103,13 @@ class LocalSession:
         # Add log handling
         self._log_handler = LocalSessionLogHandler(should_print=self._should_print_logs)
         LOG.addHandler(self._log_handler)
-        signal(SIGINT, self._sigint_handler)
-        signal(SIGTERM, self._sigint_handler)
+
+        # Signal handlers can only be installed from the main thread. Keep the handlers
+        # that were already installed so that we can put them back when we're done.
+        self._previous_signal_handlers = {}
+        if current_thread() is main_thread():
+            for signum in (SIGINT, SIGTERM):
+                self._previous_signal_handlers[signum] = signal(signum, self._sigint_handler)
         return self
 
     def __exit__(
@@ -110,8 +118,9 @@ class LocalSession:
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> None:
-        signal(SIGINT, SIG_DFL)
-        signal(SIGTERM, SIG_DFL)
+        for signum, handler in self._previous_signal_handlers.items():
+            # `signal` returns None for a handler that wasn't installed from Python
+            signal(signum, handler if handler is not None else SIG_DFL)
         self.cleanup()
 
     def _sigint_handler(self, signum: int, frame: Optional[FrameType]) -> None:
@@ -171,16 +180,16 @@ class LocalSession:
         # If the Step takes no parameters, we only need to enqueue a single Step with an empty parameter list
         for dep in dependencies:
             if not dep.parameterSpace:
-                self._action_queue.put(
+                self._action_queue.append(
                     RunTaskAction(
                         session=self._inner_session,
                         step=dep,
-                        parameters=dict[str, ParameterValue](),
+                        parameters={},
                     )
                 )
             else:
                 for parameter_set in StepParameterSpaceIterator(space=dep.parameterSpace):
-                    self._action_queue.put(
+                    self._action_queue.append(
                         RunTaskAction(
                             session=self._inner_session, step=dep, parameters=parameter_set
                         )
@@ -188,13 +197,16 @@ class LocalSession:
 
         # The Step specified by the user is the only one that needs to use custom Task parameters, if given
         if not step.parameterSpace:
-            self._action_queue.put(RunTaskAction(self._inner_session, step=step, parameters=dict()))
+            self._action_queue.append(
+                RunTaskAction(self._inner_session, step=step, parameters=dict())
+            )
 
         else:
+            parameter_sets: Iterable[TaskParameterSet]
             if not task_parameter_values:
-                parameter_sets: list[TaskParameterSet] = list(
-                    StepParameterSpaceIterator(space=step.parameterSpace)
-                )
+                # Iterate the parameter space lazily rather than materializing every
+                # parameter set, since at most `maximum_tasks` of them may be used
+                parameter_sets = StepParameterSpaceIterator(space=step.parameterSpace)
             else:
                 try:
                     parameter_sets = [
@@ -215,25 +227,25 @@ class LocalSession:
 
             # Task maximum is only imposed if the user provides a positive value
             if maximum_tasks > 0:
-                parameter_sets = parameter_sets[: min(maximum_tasks, len(parameter_sets))]
+                parameter_sets = islice(parameter_sets, maximum_tasks)
 
             for param_set in parameter_sets:
-                self._action_queue.put(
+                self._action_queue.append(
                     RunTaskAction(self._inner_session, step=step, parameters=param_set)
                 )
 
         # Finally, enqueue ExitEnvironment Actions in reverse order to EnterEnvironment
         for env_id in reversed(session_environment_ids):
-            self._action_queue.put(ExitEnvironmentAction(self._inner_session, env_id))
+            self._action_queue.append(ExitEnvironmentAction(self._inner_session, env_id))
 
     def run(self) -> None:
         if self._inner_session.state != SessionState.READY:
             raise RuntimeError("Session is not in a READY state")
 
-        self._start_seconds = time.perf_counter()
-        while not self._action_queue.empty() and not self.failed:
+        self._start_ns = time.perf_counter_ns()
+        while self._action_queue and not self.failed:
             self._action_ended.clear()
-            self._current_action = self._action_queue.get()
+            self._current_action = self._action_queue.popleft()
             self._current_action.run()
             self._action_ended.wait()
 
@@ -254,7 +266,7 @@ class LocalSession:
             )
             self._current_action = None
 
-        self._end_seconds = time.perf_counter()
+        self._end_ns = time.perf_counter_ns()
         self.ended.set()
 
     def cancel(self):
@@ -275,11 +287,10 @@ class LocalSession:
         self.failed = True
 
     def get_duration(self) -> float:
-        if not self._start_seconds:
-            return 0
-        elif not self._end_seconds:
-            return time.perf_counter() - self._start_seconds
-        return self._end_seconds - self._start_seconds
+        if self._start_ns is None:
+            return 0.0
+        end_ns = self._end_ns if self._end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self._start_ns) / 1e9
 
     def get_log_messages(self) -> list[LogEntry]:
         return self._log_handler.messages
@@ -299,48 +310,40 @@ class LocalSession:
         # We compound each error into a log message so that the user
         # can fix as many as possible at once.
 
-        defined_names = set(parameter_space.taskParameterDefinitions.keys())
-        provided_names = set(parameter_values.keys())
+        parameter_definitions = parameter_space.taskParameterDefinitions
 
         # First, check for extraneous parameters
-        extra_names = provided_names.difference(defined_names)
+        extra_names = parameter_values.keys() - parameter_definitions.keys()
         for name in extra_names:
             LOG.info(
                 msg=f"Skipping unused parameter '{name}'", extra={"session_id": self.session_id}
             )
 
         # The first value in the parameter space iterator will hold the default value
-        # we use for each missing parameter
-        default_set = StepParameterSpaceIterator(space=parameter_space)[0]
-
-        parameter_set = TaskParameterSet()
-        for name in defined_names:
-            # Note that parameter sets don't verify types, so any errors resulting from
-            # type mismatches will be raised when the inner Session attempts to use them.
-            if name in parameter_values:
-                parameter_set.update(
-                    {
-                        name: ParameterValue(
-                            type=ParameterValueType(
-                                parameter_space.taskParameterDefinitions[name].type
-                            ),
-                            value=f"{parameter_values[name]}",
-                        )
-                    }
-                )
-            else:
-                parameter_set.update(
-                    {
-                        name: ParameterValue(
-                            type=ParameterValueType(
-                                parameter_space.taskParameterDefinitions[name].type
-                            ),
-                            value=default_set[name].value,
-                        )
-                    }
-                )
+        # we use for each missing parameter. Building the iterator isn't free, so we
+        # only do so when a parameter is actually missing.
+        missing_names = parameter_definitions.keys() - parameter_values.keys()
+        default_set = (
+            StepParameterSpaceIterator(space=parameter_space)[0]
+            if missing_names
+            else TaskParameterSet()
+        )
 
-        return parameter_set
+        # Note that parameter sets don't verify types, so any errors resulting from
+        # type mismatches will be raised when the inner Session attempts to use them.
+        return TaskParameterSet(
+            {
+                name: ParameterValue(
+                    type=ParameterValueType(definition.type),
+                    value=(
+                        f"{parameter_values[name]}"
+                        if name in parameter_values
+                        else default_set[name].value
+                    ),
+                )
+                for name, definition in parameter_definitions.items()
+            }
+        )
 
     def _action_callback(self, session_id: str, new_status: ActionStatus) -> None:
         if new_status.state == ActionState.SUCCESS:
@@ -352,8 +355,7 @@ class LocalSession:
             self._action_ended.set()
 
     def _add_environments(self, envs: list) -> list[str]:
-        ids: list[str] = []
-        for env in envs:
-            self._action_queue.put(EnterEnvironmentAction(self._inner_session, env, env.name))
-            ids.append(env.name)
-        return ids
+        self._action_queue.extend(
+            EnterEnvironmentAction(self._inner_session, env, env.name) for env in envs
+        )
+        return [env.name for env in envs]
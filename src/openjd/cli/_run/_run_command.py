@@ -1,14 +1,15 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+from __future__ import annotations
+
 from argparse import ArgumentParser, Namespace
 from dataclasses import dataclass
 from pathlib import Path
 import json
-from typing import Optional
-import re
+from typing import TYPE_CHECKING, Iterator, Optional
 import logging
 
-from ._local_session._session_manager import LocalSession, LogEntry
+from ._local_session._logs import LogEntry
 from .._common import (
     OpenJDCliResult,
     generate_job,
@@ -21,9 +22,12 @@ from openjd.model import (
     EnvironmentTemplate,
     Job,
     Step,
-    StepParameterSpaceIterator,
 )
-from openjd.sessions import PathMappingRule, LOG
+
+# `openjd.sessions` is only needed once a Session is actually run, so it is imported
+# within the functions that use it to keep it out of the startup cost of other commands.
+if TYPE_CHECKING:
+    from openjd.sessions import PathMappingRule
 
 
 @dataclass
@@ -138,36 +142,56 @@ def add_run_arguments(run_parser: ArgumentParser):
 
 def _collect_required_steps(step_map: dict[str, Step], step: Step) -> list[Step]:
     """
-    Recursively traverses through a Step's dependencies to create an ordered list of
-    Steps to run in the local Session.
+    Traverses through a Step's dependencies to create an ordered list of Steps to
+    run in the local Session. Each Step is visited once, so Steps shared by several
+    dependency paths are only traversed the first time they are reached.
     """
-    if step.stepEnvironments:
-        # Currently, we only support running one local Session, so any Steps with Step-specific environments
-        # must not depend on/be a dependency for other Steps.
-        raise RuntimeError(
-            f"ERROR: Step '{step.name}' has Step-level environments and cannot be run in the same local Session as the other dependencies."
-        )
-
-    if not step.dependencies:
-        return [step]
-
     required_steps: list[Step] = []
+    collected_names: set[str] = set()
+    # The Steps currently being traversed, in order, used to report dependency cycles
+    path: dict[str, None] = {}
+    # The traversal is iterative so that long dependency chains can't exhaust the call stack.
+    # Each entry holds a Step and an iterator over its dependencies that are yet to be visited.
+    stack: list[tuple[Step, Iterator]] = []
+
+    def push(current: Step) -> None:
+        if current.stepEnvironments:
+            # Currently, we only support running one local Session, so any Steps with Step-specific environments
+            # must not depend on/be a dependency for other Steps.
+            raise RuntimeError(
+                f"ERROR: Step '{current.name}' has Step-level environments and cannot be run in the same local Session as the other dependencies."
+            )
+        path[current.name] = None
+        stack.append((current, iter(current.dependencies or [])))
+
+    push(step)
+    while stack:
+        current, remaining_dependencies = stack[-1]
+        dep = next(remaining_dependencies, None)
+        if dep is None:
+            # All of this Step's dependencies have been collected
+            stack.pop()
+            del path[current.name]
+            collected_names.add(current.name)
+            required_steps.append(current)
+            continue
 
-    try:
-        for dep in step.dependencies:
-            dependency_name = dep.dependsOn
-            # Collect transitive dependencies in the recursive call,
-            # then remove duplicates
-            collected = _collect_required_steps(step_map, step_map[dependency_name])
-            required_steps += [new_step for new_step in collected if new_step not in required_steps]
-    except KeyError:
-        # This should technically raise a validation error when creating a Job,
-        # but we check again here for thoroughness
-        raise RuntimeError(
-            f"ERROR: Dependency '{dependency_name}' in Step '{step.name}' is not an existing Step."
-        )
-
-    required_steps.append(step)
+        dependency_name = dep.dependsOn
+        if dependency_name in collected_names:
+            continue
+        if dependency_name in path:
+            path_names = list(path)
+            cycle = path_names[path_names.index(dependency_name) :] + [dependency_name]
+            raise RuntimeError(
+                f"ERROR: Step '{current.name}' has a circular dependency: {' -> '.join(cycle)}"
+            )
+        if dependency_name not in step_map:
+            # This should technically raise a validation error when creating a Job,
+            # but we check again here for thoroughness
+            raise RuntimeError(
+                f"ERROR: Dependency '{dependency_name}' in Step '{current.name}' is not an existing Step."
+            )
+        push(step_map[dependency_name])
 
     return required_steps
 
@@ -188,27 +212,24 @@ def _process_task_params(arguments: list[str]) -> dict[str, str]:
     Raises:
         RuntimeError if any arguments do not match the required pattern
     """
-    parameter_set = dict[str, str]()
+    parameter_set: dict[str, str] = {}
 
     error_list: list[str] = []
     for arg in arguments:
         arg = arg.lstrip()
-        if regex_match := re.match("([^=]+)=(.+)", arg):
-            param, value = regex_match[1], regex_match[2]
-            if parameter_set.get(param) is not None:
-                error_list.append(f"Task parameter '{param}' has been defined more than once.")
-            else:
-                parameter_set[param] = value
-            pass
-        else:
+        param, _, value = arg.partition("=")
+        if not param or not value:
             error_list.append(
                 f"Task parameter '{arg}' defined incorrectly. Expected '<NAME>=<VALUE>' format."
             )
+        elif param in parameter_set:
+            error_list.append(f"Task parameter '{param}' has been defined more than once.")
+        else:
+            parameter_set[param] = value
 
     if error_list:
-        error_msg = "Found the following errors collecting Task parameters:"
-        for error in error_list:
-            error_msg += f"\n- {error}"
+        error_msg = "Found the following errors collecting Task parameters:\n- "
+        error_msg += "\n- ".join(error_list)
         raise RuntimeError(error_msg)
 
     return parameter_set
@@ -268,6 +289,43 @@ def _process_tasks(argument: str) -> list[dict[str, str]]:
     return parameter_sets
 
 
+def _process_path_mapping_rules(argument: str) -> list[PathMappingRule]:
+    """
+    Retrieves the path mapping rules from the user-provided --path-mapping-rules argument.
+
+    Args:
+        argument (str): Either a JSON document following the 'pathmapping-1.0' schema, or
+            the filename of such a document prefixed with 'file://'.
+
+    Returns:
+        list[PathMappingRule]: The path mapping rules defined in the document.
+
+    Raises:
+        RuntimeError if the document cannot be read or does not follow the 'pathmapping-1.0' schema
+    """
+    from openjd.sessions import PathMappingRule
+
+    try:
+        if argument.startswith("file://"):
+            filename = Path(argument.removeprefix("file://")).expanduser()
+            with open(filename, "rb") as f:
+                parsed_rules = json.load(f)
+        else:
+            parsed_rules = json.loads(argument)
+    except OSError as exc:
+        raise RuntimeError(f"Could not open path mapping rules file: {str(exc)}")
+    except ValueError:
+        raise RuntimeError("Path mapping rules must be a JSON document.")
+
+    if not isinstance(parsed_rules, dict) or parsed_rules.get("version") != "pathmapping-1.0":
+        raise RuntimeError("Path mapping rules must have a 'version' value of 'pathmapping-1.0'")
+    rules_list = parsed_rules.get("path_mapping_rules")
+    if not isinstance(rules_list, list):
+        raise RuntimeError("Path mapping rules must contain a list named 'path_mapping_rules'")
+
+    return [PathMappingRule.from_dict(rule) for rule in rules_list]
+
+
 def _validate_task_params(step: Step, task_params: list[dict[str, str]]) -> None:
     # For each task parameter set, verify:
     #  1) There are no parameters defined that don't exist in the template.
@@ -276,20 +334,24 @@ def _validate_task_params(step: Step, task_params: list[dict[str, str]]) -> None
     #       - We need openjd.model.StepParameterSpaceIterator to have a membership test first to be able to do
     #         this last check.
 
+    if not task_params:
+        return
+
     # Collect the names of all of the task parameters defined in the step.
+    # These are the same names that StepParameterSpaceIterator reports, but reading them
+    # from the definitions avoids parsing the Step's combination expression.
+    task_parameter_names: frozenset[str] = frozenset()
     if step.parameterSpace is not None:
-        parameter_space = StepParameterSpaceIterator(space=step.parameterSpace)
-        task_parameter_names: set[str] = set(parameter_space.names)
-    else:
-        task_parameter_names = set[str]()
+        task_parameter_names = frozenset(step.parameterSpace.taskParameterDefinitions)
 
-    error_list = list[str]()
+    error_list: list[str] = []
     for i, parameter_set in enumerate(task_params):
-        defined_params = set(parameter_set.keys())
-        if defined_params == task_parameter_names:
+        # Comparing the keys view directly avoids building a set for valid parameter sets.
+        if parameter_set.keys() == task_parameter_names:
             continue
-        extra_names = defined_params.difference(task_parameter_names)
-        missing_names = task_parameter_names.difference(defined_params)
+        defined_params = frozenset(parameter_set)
+        extra_names = defined_params - task_parameter_names
+        missing_names = task_parameter_names - defined_params
         if extra_names:
             error_list.append(
                 f"Task {i} defines unknown parameters: {', '.join(sorted(extra_names))}"
@@ -300,15 +362,12 @@ def _validate_task_params(step: Step, task_params: list[dict[str, str]]) -> None
             )
 
     if error_list:
-        error_msg = "Errors defining task parameter values:\n - "
-        error_msg += "\n - ".join(error_list)
-        raise RuntimeError(error_msg)
+        raise RuntimeError("Errors defining task parameter values:\n - " + "\n - ".join(error_list))
 
 
 def _run_local_session(
     *,
     job: Job,
-    step_map: dict[str, Step],
     step: Step,
     maximum_tasks: int = -1,
     task_parameter_values: list[dict] = [],
@@ -322,9 +381,13 @@ def _run_local_session(
     Creates a Session object and listens for log messages to synchronously end the session.
     """
 
+    from ._local_session._session_manager import LocalSession
+
     dependencies: list[Step] = []
     try:
         if should_run_dependencies and step.dependencies:
+            # Map Step names to Step objects so they can be easily accessed
+            step_map = {job_step.name: job_step for job_step in job.steps}
             # Raises: RuntimeError
             dependencies = _collect_required_steps(step_map, step)[:-1]
     except RuntimeError as rte:
@@ -386,6 +449,7 @@ def do_run(args: Namespace) -> OpenJDCliResult:
     a list of Task parameter sets; the Session will run the Step with each of the provided parameter
     sets in sequence.
     """
+    from openjd.sessions import LOG
 
     environments: list[EnvironmentTemplate] = []
     if args.environments:
@@ -400,24 +464,11 @@ def do_run(args: Namespace) -> OpenJDCliResult:
 
     path_mapping_rules: Optional[list[PathMappingRule]] = None
     if args.path_mapping_rules:
-        if args.path_mapping_rules.startswith("file://"):
-            filename = Path(args.path_mapping_rules.removeprefix("file://")).expanduser()
-            with open(filename, encoding="utf8") as f:
-                parsed_rules = json.load(f)
-        else:
-            parsed_rules = json.loads(args.path_mapping_rules)
-        if parsed_rules.get("version", None) != "pathmapping-1.0":
-            return OpenJDCliResult(
-                status="error",
-                message="Path mapping rules must have a 'version' value of 'pathmapping-1.0'",
-            )
-        if not isinstance(parsed_rules.get("path_mapping_rules", None), list):
-            return OpenJDCliResult(
-                status="error",
-                message="Path mapping rules must contain a list named 'path_mapping_rules'",
-            )
-        rules_list = parsed_rules.get("path_mapping_rules")
-        path_mapping_rules = [PathMappingRule.from_dict(rule) for rule in rules_list]
+        try:
+            # Raises: RuntimeError
+            path_mapping_rules = _process_path_mapping_rules(args.path_mapping_rules)
+        except RuntimeError as rte:
+            return OpenJDCliResult(status="error", message=str(rte))
 
     if args.verbose:
         LOG.setLevel(logging.DEBUG)
@@ -426,10 +477,8 @@ def do_run(args: Namespace) -> OpenJDCliResult:
         # Raises: RuntimeError
         the_job = generate_job(args)
 
-        # Map Step names to Step objects so they can be easily accessed
-        step_map = {step.name: step for step in the_job.steps}
-
-        if args.step not in step_map:
+        step = next((step for step in the_job.steps if step.name == args.step), None)
+        if step is None:
             raise RuntimeError(
                 f"No Step with name '{args.step}' is defined in the given Job Template."
             )
@@ -440,15 +489,14 @@ def do_run(args: Namespace) -> OpenJDCliResult:
         elif args.tasks:
             task_params = _process_tasks(args.tasks)
 
-        _validate_task_params(step_map[args.step], task_params)
+        _validate_task_params(step, task_params)
 
     except RuntimeError as rte:
         return OpenJDCliResult(status="error", message=str(rte))
 
     return _run_local_session(
         job=the_job,
-        step_map=step_map,
-        step=step_map[args.step],
+        step=step,
         task_parameter_values=task_params,
         maximum_tasks=args.maximum_tasks,
         environments=environments,
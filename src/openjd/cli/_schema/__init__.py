@@ -12,6 +12,6 @@ def populate_argparser(subcommands: SubparserGroup) -> None:
         "schema",
         description="Returns a JSON Schema document for the Job template model.",
     )
-    add_common_arguments(schema_parser, set())
+    add_common_arguments(schema_parser)
     add_schema_arguments(schema_parser)
     schema_parser.set_defaults(func=do_get_schema)
@@ -1,8 +1,11 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 from argparse import ArgumentParser, Namespace
+from copy import deepcopy
+from functools import lru_cache
 import json
-from typing import Union
+import re
+from typing import Any, Iterable, Union
 
 from .._common import OpenJDCliResult, print_cli_result
 from openjd.model import EnvironmentTemplate, JobTemplate, TemplateSpecificationVersion
@@ -24,18 +27,45 @@ def add_schema_arguments(schema_parser: ArgumentParser) -> None:
     )
 
 
-def _process_regex(target: dict) -> None:
+# Python-specific regex syntax emitted by Pydantic, and its JSON Schema equivalent
+_PYTHON_REGEX_SYNTAX = re.compile(r"\(\?-m:|\\Z")
+_JSON_REGEX_SYNTAX = {"(?-m:": "(?:", "\\Z": "$"}
+
+
+def _process_regex(target: Union[dict, list]) -> None:
     """
     Translates Python's language-specific regex into a JSON-compatible format.
     """
 
-    if "pattern" in target and isinstance(target["pattern"], str):
-        target["pattern"] = target["pattern"].replace("(?-m:", "(?:")
-        target["pattern"] = target["pattern"].replace("\\Z", "$")
+    children: Iterable[Any]
+    if isinstance(target, dict):
+        pattern = target.get("pattern")
+        if isinstance(pattern, str):
+            target["pattern"] = _PYTHON_REGEX_SYNTAX.sub(
+                lambda match: _JSON_REGEX_SYNTAX[match[0]], pattern
+            )
+        children = target.values()
+    else:
+        children = target
+
+    for child in children:
+        if isinstance(child, (dict, list)):
+            _process_regex(child)
 
-    for attr in target.keys():
-        if isinstance(target[attr], dict):
-            _process_regex(target[attr])
+
+@lru_cache(maxsize=None)
+def _generate_schema(Template: Union[type[JobTemplate], type[EnvironmentTemplate]]) -> str:
+    """
+    Generates the JSON schema document for the given template model. The document only
+    depends on the model, so it is generated once per process and reused afterwards.
+    """
+    # The `schema` attribute will have to be updated if/when Pydantic
+    # is updated to v2.
+    # (AFAIK it can be replaced with `model_json_schema()`.)
+    # Pydantic returns its own cached copy of the schema, so modify a copy of it instead.
+    schema_doc = deepcopy(Template.schema())
+    _process_regex(schema_doc)
+    return json.dumps(schema_doc, indent=4)
 
 
 @print_cli_result
@@ -56,15 +86,9 @@ def do_get_schema(args: Namespace) -> OpenJDCliResult:
             status="error", message=f"ERROR: Cannot generate schema for version '{args.version}'."
         )
 
-    schema_doc: dict = {}
-
     try:
-        # The `schema` attribute will have to be updated if/when Pydantic
-        # is updated to v2.
-        # (AFAIK it can be replaced with `model_json_schema()`.)
-        schema_doc = Template.schema()
-        _process_regex(schema_doc)
+        schema_json = _generate_schema(Template)
     except Exception as e:
         return OpenJDCliResult(status="error", message=f"ERROR generating schema: {str(e)}")
 
-    return OpenJDCliResult(status="success", message=json.dumps(schema_doc, indent=4))
+    return OpenJDCliResult(status="success", message=schema_json)
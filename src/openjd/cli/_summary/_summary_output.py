@@ -2,33 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Optional
+from typing import Optional
 
 from .._common import OpenJDCliResult
 from openjd.model import Job, Step, StepParameterSpaceIterator
 
 
-def _populate_summary_list(source: list, to_summary_func: Callable) -> list:
-    """
-    Given a list of elements, uses the `to_summary_func` argument
-    to transform each element into a summary dataclass, returning
-    the list of summary objects.
-    """
-    summary_list: list = []
-    for item in source:
-        summary_list.append(to_summary_func(item))
-    return summary_list
-
-
 def _format_summary_list(data: list, padding: int = 0) -> str:
     """
     Prints the supplied list of summary objects as a bulleted list.
     """
-    formatted_list: str = ""
-    for item in data:
-        formatted_list += "\t" * padding + f"- {str(item)}\n"
-
-    return formatted_list
+    prefix = "\t" * padding + "- "
+    return "".join(f"{prefix}{item}\n" for item in data)
 
 
 @dataclass
@@ -96,20 +81,20 @@ class StepSummary:
     dependencies: Optional[list[DependencySummary]]
 
     def __str__(self) -> str:
-        summary_str = f"'{self.name}'\n"
+        summary_parts = [f"'{self.name}'\n"]
 
         if self.parameter_definitions:
-            summary_str += f"\t{len(self.parameter_definitions)} Task parameter(s)\n"
+            summary_parts.append(f"\t{len(self.parameter_definitions)} Task parameter(s)\n")
 
-        summary_str += f"\t{self.total_tasks} total Tasks\n"
+        summary_parts.append(f"\t{self.total_tasks} total Tasks\n")
 
         if self.environments:
-            summary_str += f"\t{len(self.environments)} environments\n"
+            summary_parts.append(f"\t{len(self.environments)} environments\n")
 
         if self.dependencies:
-            summary_str += f"\t{len(self.dependencies)} dependencies\n"
+            summary_parts.append(f"\t{len(self.dependencies)} dependencies\n")
 
-        return summary_str
+        return "".join(summary_parts)
 
 
 @dataclass
@@ -127,34 +112,37 @@ class OpenJDJobSummaryResult(OpenJDCliResult):
     steps: list[StepSummary]
 
     def __str__(self) -> str:
-        summary_str = f"\n--- {self.message} ---\n"
+        summary_parts = [f"\n--- {self.message} ---\n"]
 
         # For each parameter, print its name and its value (may be default or user-provided)
         if self.parameter_definitions:
-            summary_str += (
+            summary_parts.append(
                 f"\nParameters:\n{_format_summary_list(self.parameter_definitions, padding=1)}"
             )
 
-        summary_str += f"""
+        summary_parts.append(
+            f"""
 Total steps: {self.total_steps}
 Total tasks: {self.total_tasks}
 Total environments: {self.total_environments}
 """
+        )
 
-        summary_str += f"\n--- Steps in '{self.name}' ---\n\n"
-        for index, step in enumerate(self.steps):
-            summary_str += f"{index+1}. {str(step)}\n"
+        summary_parts.append(f"\n--- Steps in '{self.name}' ---\n\n")
+        summary_parts.extend(
+            f"{index}. {str(step)}\n" for index, step in enumerate(self.steps, start=1)
+        )
 
         if self.total_environments:
-            summary_str += f"\n--- Environments in '{self.name}' ---\n"
+            summary_parts.append(f"\n--- Environments in '{self.name}' ---\n")
             if self.root_environments:
-                summary_str += _format_summary_list(self.root_environments)
+                summary_parts.append(_format_summary_list(self.root_environments))
 
-            for step in self.steps:
-                if step.environments:
-                    summary_str += _format_summary_list(step.environments)
+            summary_parts.extend(
+                _format_summary_list(step.environments) for step in self.steps if step.environments
+            )
 
-        return summary_str
+        return "".join(summary_parts)
 
 
 @dataclass
@@ -173,24 +161,30 @@ class OpenJDStepSummaryResult(OpenJDCliResult):
     dependencies: Optional[list[DependencySummary]]
 
     def __str__(self) -> str:
-        summary_str = f"""
+        summary_parts = [
+            f"""
 --- {self.message} ---
 
 Total tasks: {self.total_tasks}
 Total task parameters: {self.total_parameters}
 Total environments: {self.total_environments}
 """
+        ]
 
         if self.dependencies:
-            summary_str += f"\nDependencies ({len(self.dependencies)}):\n{_format_summary_list(self.dependencies)}"
+            summary_parts.append(
+                f"\nDependencies ({len(self.dependencies)}):\n{_format_summary_list(self.dependencies)}"
+            )
 
         if self.parameter_definitions:
-            summary_str += f"\nParameters:\n{_format_summary_list(self.parameter_definitions)}"
+            summary_parts.append(
+                f"\nParameters:\n{_format_summary_list(self.parameter_definitions)}"
+            )
 
         if self.environments:
-            summary_str += f"\nEnvironments:\n{_format_summary_list(self.environments)}"
+            summary_parts.append(f"\nEnvironments:\n{_format_summary_list(self.environments)}")
 
-        return summary_str
+        return "".join(summary_parts)
 
 
 def _get_step_summary(step: Step) -> StepSummary:
@@ -206,28 +200,22 @@ def _get_step_summary(step: Step) -> StepSummary:
 
     parameter_definitions = []
     if step.parameterSpace:
-        parameter_definitions = _populate_summary_list(
-            [(name, param) for name, param in step.parameterSpace.taskParameterDefinitions.items()],
-            lambda param_tuple: ParameterSummary(
-                name=param_tuple[0], description=None, type=param_tuple[1].type.name, value=None
-            ),
-        )
+        parameter_definitions = [
+            ParameterSummary(name=name, description=None, type=param.type.name, value=None)
+            for name, param in step.parameterSpace.taskParameterDefinitions.items()
+        ]
         total_tasks = len(StepParameterSpaceIterator(space=step.parameterSpace))
 
     environments = []
     if step.stepEnvironments:
-        environments = _populate_summary_list(
-            step.stepEnvironments,
-            lambda env: EnvironmentSummary(
-                name=env.name, parent=step.name, description=env.description
-            ),
-        )
+        environments = [
+            EnvironmentSummary(name=env.name, parent=step.name, description=env.description)
+            for env in step.stepEnvironments
+        ]
 
     dependencies = []
     if step.dependencies:
-        dependencies = _populate_summary_list(
-            step.dependencies, lambda dep: DependencySummary(step_name=dep.dependsOn)
-        )
+        dependencies = [DependencySummary(step_name=dep.dependsOn) for dep in step.dependencies]
 
     return StepSummary(
         name=step.name,
@@ -244,61 +232,67 @@ def output_summary_result(job: Job, step_name: str | None = None) -> OpenJDCliRe
     Returns a CLI result object with information about this Job.
     """
 
-    steps_list: list[StepSummary] = [_get_step_summary(step) for step in job.steps]
-    step_envs = sum(len(step.environments) if step.environments else 0 for step in steps_list)
-
-    if not step_name:
-        # We only need information about parameters and root environments
-        # if we're summarizing an entire Job
-
-        params_list: list[ParameterSummary] = []
-        if job.parameters:
-            params_list = _populate_summary_list(
-                [(name, param) for name, param in job.parameters.items()],
-                lambda param_tuple: ParameterSummary(
-                    name=param_tuple[0],
-                    description=param_tuple[1].description,
-                    type=param_tuple[1].type.name,
-                    value=param_tuple[1].value,
-                ),
+    if step_name:
+        # Only the requested Step needs to be summarized
+        job_step = next((job_step for job_step in job.steps if job_step.name == step_name), None)
+        if job_step is None:
+            return OpenJDCliResult(
+                status="error", message=f"Step '{step_name}' does not exist in Job '{job.name}'."
             )
 
-        envs_list: list[EnvironmentSummary] = []
-        if job.jobEnvironments:
-            envs_list = _populate_summary_list(
-                job.jobEnvironments,
-                lambda env: EnvironmentSummary(name=env.name, description=env.description),
-            )
-
-        return OpenJDJobSummaryResult(
+        step = _get_step_summary(job_step)
+        return OpenJDStepSummaryResult(
             status="success",
-            message=f"Summary for '{job.name}'",
-            name=job.name,
-            parameter_definitions=params_list if params_list else None,
-            total_steps=len(steps_list),
-            total_tasks=sum(step.total_tasks for step in steps_list),
-            total_environments=len(envs_list) + step_envs if envs_list else step_envs,
-            root_environments=envs_list if envs_list else None,
-            steps=steps_list,
+            message=f"Summary for Step '{step.name}' in Job '{job.name}'",
+            job_name=job.name,
+            step_name=step.name,
+            total_parameters=len(step.parameter_definitions) if step.parameter_definitions else 0,
+            parameter_definitions=step.parameter_definitions,
+            total_tasks=step.total_tasks,
+            total_environments=len(step.environments) if step.environments else 0,
+            environments=step.environments,
+            dependencies=step.dependencies,
         )
 
-    for step in steps_list:
-        if step.name == step_name:
-            return OpenJDStepSummaryResult(
-                status="success",
-                message=f"Summary for Step '{step.name}' in Job '{job.name}'",
-                job_name=job.name,
-                step_name=step.name,
-                total_parameters=(
-                    len(step.parameter_definitions) if step.parameter_definitions else 0
-                ),
-                parameter_definitions=step.parameter_definitions,
-                total_tasks=step.total_tasks,
-                total_environments=len(step.environments) if step.environments else 0,
-                environments=step.environments,
-                dependencies=step.dependencies,
+    # We only need information about parameters and root environments
+    # if we're summarizing an entire Job
+    steps_list: list[StepSummary] = []
+    total_tasks = 0
+    step_envs = 0
+    for job_step in job.steps:
+        step = _get_step_summary(job_step)
+        steps_list.append(step)
+        total_tasks += step.total_tasks
+        if step.environments:
+            step_envs += len(step.environments)
+
+    params_list: list[ParameterSummary] = []
+    if job.parameters:
+        params_list = [
+            ParameterSummary(
+                name=name,
+                description=param.description,
+                type=param.type.name,
+                value=param.value,
             )
-
-    return OpenJDCliResult(
-        status="error", message=f"Step '{step_name}' does not exist in Job '{job.name}'."
+            for name, param in job.parameters.items()
+        ]
+
+    envs_list: list[EnvironmentSummary] = []
+    if job.jobEnvironments:
+        envs_list = [
+            EnvironmentSummary(name=env.name, description=env.description)
+            for env in job.jobEnvironments
+        ]
+
+    return OpenJDJobSummaryResult(
+        status="success",
+        message=f"Summary for '{job.name}'",
+        name=job.name,
+        parameter_definitions=params_list if params_list else None,
+        total_steps=len(steps_list),
+        total_tasks=total_tasks,
+        total_environments=len(envs_list) + step_envs,
+        root_environments=envs_list if envs_list else None,
+        steps=steps_list,
     )
@@ -1,5 +1,6 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import json
 import pytest
 from enum import Enum
 
@@ -119,6 +120,9 @@ MOCK_TEMPLATE = {
     ],
 }
 
+# MOCK_TEMPLATE serialized once, for tests that write it to a file
+MOCK_TEMPLATE_JSON = json.dumps(MOCK_TEMPLATE)
+
 # Map of Step names to Step indices for more readable test cases
 
 
@@ -1,48 +1,64 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
-import os
 import pytest
-import tempfile
+import yaml
 from pathlib import Path
 from unittest.mock import patch
 
-from . import MOCK_TEMPLATE, SampleSteps
+from . import MOCK_TEMPLATE, MOCK_TEMPLATE_JSON, SampleSteps
 from openjd.cli._common._job_from_template import job_from_template
+from openjd.cli._common._validation_utils import YamlSafeDumper
 from openjd.cli._run._local_session._session_manager import LocalSession
 from openjd.model import decode_job_template
 
 
+@pytest.fixture(scope="session")
+def sample_job_template():
+    """
+    Decodes MOCK_TEMPLATE once for the whole test session. Tests only
+    read the decoded template, so it is safe to share.
+    """
+    return decode_job_template(template=MOCK_TEMPLATE)
+
+
+@pytest.fixture(scope="session")
+def mock_template_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """
+    Writes MOCK_TEMPLATE once per test session as both a JSON and a YAML file,
+    keyed by file extension. Tests only read these files and must not modify them.
+    """
+    template_dir = tmp_path_factory.mktemp("mock_templates")
+    json_template = template_dir / "mock.template.json"
+    json_template.write_text(MOCK_TEMPLATE_JSON, encoding="utf8")
+    yaml_template = template_dir / "mock.template.yaml"
+    yaml_template.write_text(yaml.dump(MOCK_TEMPLATE, Dumper=YamlSafeDumper), encoding="utf8")
+    return {".template.json": json_template, ".template.yaml": yaml_template}
+
+
 @pytest.fixture(scope="function", params=[[], ["Message=A new message!"]])
-def sample_job_and_dirs(request):
+def sample_job_and_dirs(request, tmp_path: Path, sample_job_template):
     """
     Uses the MOCK_TEMPLATE object to create a Job, once
     with default parameters and once with user-specified parameters.
 
-    This fixture also manages the life time of a temporary directory that's
+    This fixture also creates the temporary directories that are
     used for the job template dir and the current working directory.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        template_dir = Path(tmpdir) / "template_dir"
-        current_working_dir = Path(tmpdir) / "current_working_dir"
-        os.makedirs(template_dir)
-        os.makedirs(current_working_dir)
-
-        template = decode_job_template(template=MOCK_TEMPLATE)
-        yield (
-            job_from_template(
-                template=template,
-                parameter_args=request.param,
-                job_template_dir=template_dir,
-                current_working_dir=current_working_dir,
-            ),
-            template_dir,
-            current_working_dir,
-        )
+    template_dir = tmp_path / "template_dir"
+    current_working_dir = tmp_path / "current_working_dir"
+    template_dir.mkdir()
+    current_working_dir.mkdir()
 
-
-@pytest.fixture(scope="function")
-def sample_step_map(sample_job_and_dirs):
-    return {step.name: step for step in sample_job_and_dirs[0].steps}
+    return (
+        job_from_template(
+            template=sample_job_template,
+            parameter_args=request.param,
+            job_template_dir=template_dir,
+            current_working_dir=current_working_dir,
+        ),
+        template_dir,
+        current_working_dir,
+    )
 
 
 @pytest.fixture(
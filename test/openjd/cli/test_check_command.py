@@ -2,39 +2,25 @@
 
 from argparse import Namespace
 from pathlib import Path
-from typing import Callable
-import json
 import pytest
-import tempfile
-import yaml
 
-from . import MOCK_TEMPLATE
 from openjd.cli._check._check_command import do_check
 
 
 @pytest.mark.parametrize(
-    "tempfile_extension,doc_serializer",
+    "tempfile_extension",
     [
-        pytest.param(".template.json", json.dump, id="Successful JSON"),
-        pytest.param(".template.yaml", yaml.dump, id="Successful YAML"),
+        pytest.param(".template.json", id="Successful JSON"),
+        pytest.param(".template.yaml", id="Successful YAML"),
     ],
 )
-def test_do_check_file_success(tempfile_extension: str, doc_serializer: Callable):
+def test_do_check_file_success(tempfile_extension: str, mock_template_files: dict[str, Path]):
     """
     Execution should succeed given a correct filepath and JSON/YAML body
     """
-    temp_template = None
-
-    with tempfile.NamedTemporaryFile(
-        mode="w+t", suffix=tempfile_extension, encoding="utf8", delete=False
-    ) as temp_template:
-        doc_serializer(MOCK_TEMPLATE, temp_template.file)
-
-    mock_args = Namespace(path=Path(temp_template.name), output="human-readable")
+    mock_args = Namespace(path=mock_template_files[tempfile_extension], output="human-readable")
     do_check(mock_args)
 
-    Path(temp_template.name).unlink()
-
 
 def test_do_check_file_error():
     """
@@ -48,11 +34,10 @@ def test_do_check_file_error():
         do_check(mock_args)
 
 
-def test_do_check_bundle_error():
+def test_do_check_bundle_error(tmp_path: Path):
     """
     Test that passing a bundle with no template file yields a SystemError
     """
-    with tempfile.TemporaryDirectory() as temp_bundle:
-        mock_args = Namespace(path=Path(temp_bundle), output="human-readable")
-        with pytest.raises(SystemExit):
-            do_check(mock_args)
+    mock_args = Namespace(path=tmp_path, output="human-readable")
+    with pytest.raises(SystemExit):
+        do_check(mock_args)
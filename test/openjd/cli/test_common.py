@@ -1,111 +1,166 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 from argparse import Namespace
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Callable
+from typing import Optional
 from unittest.mock import ANY, Mock, patch
 import json
 import os
 import pytest
-import tempfile
-import yaml
 
 from . import (
     MOCK_TEMPLATE,
+    MOCK_TEMPLATE_JSON,
     MOCK_TEMPLATE_REQUIRES_PARAMS,
     MOCK_PARAM_ARGUMENTS,
     MOCK_PARAM_VALUES,
 )
 from openjd.cli._common import (
+    OpenJDCliResult,
+    _asdict_omit_null,
     generate_job,
+    get_doc_type,
     get_job_params,
     read_template,
     read_job_template,
     read_environment_template,
 )
 from openjd.cli._common._job_from_template import job_from_template
+from openjd.cli._common._validation_utils import load_document
 from openjd.model import (
     DecodeValidationError,
+    DocumentType,
     decode_template,
 )
 
 
 @pytest.fixture(scope="function")
-def template_dir_and_cwd():
+def template_dir_and_cwd(tmp_path: Path):
     """
-    This fixture manages the life time of a temporary directory that's
-    used for the job template dir and the current working directory.
+    This fixture creates the temporary directories that are used for
+    the job template dir and the current working directory.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        template_dir = Path(tmpdir) / "template_dir"
-        current_working_dir = Path(tmpdir) / "current_working_dir"
-        os.makedirs(template_dir)
-        os.makedirs(current_working_dir)
+    template_dir = tmp_path / "template_dir"
+    current_working_dir = tmp_path / "current_working_dir"
+    template_dir.mkdir()
+    current_working_dir.mkdir()
 
-        yield (template_dir, current_working_dir)
+    return (template_dir, current_working_dir)
 
 
 @pytest.mark.parametrize(
-    "tempfile_extension,doc_serializer",
+    "filename,expected_doc_type",
     [
-        pytest.param(".template.json", json.dump, id="Successful JSON"),
-        pytest.param(".template.yaml", yaml.dump, id="Successful YAML"),
+        pytest.param("template.json", DocumentType.JSON, id="JSON"),
+        pytest.param("template.JSON", DocumentType.JSON, id="Uppercase JSON"),
+        pytest.param("template.yaml", DocumentType.YAML, id="YAML"),
+        pytest.param("template.Yml", DocumentType.YAML, id="Mixed case YML"),
     ],
 )
-def test_read_template_success(tempfile_extension: str, doc_serializer: Callable):
+def test_get_doc_type_success(filename: str, expected_doc_type: DocumentType):
+    """
+    Tests that `get_doc_type` maps file extensions to a document type regardless of case
+    """
+    assert get_doc_type(Path(filename)) == expected_doc_type
+
+
+@pytest.mark.parametrize("filename", ["template.txt", "template", "template.json.bak"])
+def test_get_doc_type_error(filename: str):
+    """
+    Tests that `get_doc_type` raises a RuntimeError for extensions that aren't JSON or YAML
+    """
+    with pytest.raises(RuntimeError) as rte:
+        get_doc_type(Path(filename))
+
+    assert "is not JSON or YAML" in str(rte.value)
+
+
+@pytest.mark.parametrize(
+    "tempfile_extension",
+    [
+        pytest.param(".template.json", id="Successful JSON"),
+        pytest.param(".template.yaml", id="Successful YAML"),
+    ],
+)
+def test_read_template_success(tempfile_extension: str, mock_template_files: dict[str, Path]):
     """
     Tests that "read_template" can decode a JSON and YAML file,
     resulting in a Job Template with the same name and number of steps
     """
-    temp_template = None
+    result = read_template(mock_template_files[tempfile_extension])
+    assert result == MOCK_TEMPLATE
 
-    with tempfile.NamedTemporaryFile(
-        mode="w+t", suffix=tempfile_extension, encoding="utf8", delete=False
-    ) as temp_template:
-        doc_serializer(MOCK_TEMPLATE, temp_template)
 
-    template_filename = Path(temp_template.name)
-    result = read_template(template_filename)
-    assert result == MOCK_TEMPLATE
+def test_load_document_reads_changes(tmp_path: Path):
+    """
+    Tests that `load_document` returns a fresh document on every call, so changes made by a
+    caller or to the file on disk are never hidden from later reads.
+    """
+    template_filename = tmp_path / "template.json"
+    template_filename.write_text(MOCK_TEMPLATE_JSON, encoding="utf8")
 
-    template_filename.unlink()
+    first = load_document(template_filename)
+    first["name"] = "modified-by-caller"
+    assert load_document(template_filename) == MOCK_TEMPLATE
+
+    modified_template = dict(MOCK_TEMPLATE, name="a-different-name")
+    template_filename.write_text(json.dumps(modified_template), encoding="utf8")
+
+    assert load_document(template_filename) == modified_template
 
 
 @pytest.mark.parametrize(
-    "mock_exists_response,mock_is_file_response,expected_error",
+    "path_kind,expected_error",
     [
-        pytest.param(
-            False, False, "'some-file.json' does not exist.", id="Filepath does not exist"
-        ),
-        pytest.param(
-            True,
-            False,
-            "'some-file.json' is not a file.",
-            id="Path is not a file",
-        ),
-        pytest.param(
-            True,
-            True,
-            "Could not open file 'some-file.json':",
-            id="File can't be read",
-        ),
+        pytest.param("missing", "'{path}' does not exist.", id="Filepath does not exist"),
+        pytest.param("directory", "'{path}' is not a file.", id="Path is not a file"),
+        pytest.param("unreadable", "Could not open file '{path}':", id="File can't be read"),
     ],
 )
-def test_read_template_fileerror(
-    mock_exists_response: bool, mock_is_file_response: bool, expected_error: str
-):
+def test_read_template_fileerror(path_kind: str, expected_error: str, tmp_path: Path):
     """
     Tests that `read_template` raises a RuntimeError when unable to open a file
     """
-    args = Path("some-file.json")
+    template_path = tmp_path / "some-file.json"
+    if path_kind == "directory":
+        template_path.mkdir()
+    elif path_kind == "unreadable":
+        template_path.write_text(MOCK_TEMPLATE_JSON, encoding="utf8")
+
     with (
         pytest.raises(RuntimeError) as rte,
-        patch.object(Path, "exists", Mock(return_value=mock_exists_response)),
-        patch.object(Path, "is_file", Mock(return_value=mock_is_file_response)),
+        patch(
+            "openjd.cli._common._validation_utils.open",
+            create=True,
+            new=Mock(side_effect=PermissionError("Permission denied")),
+        ),
     ):
-        read_template(args)
+        read_template(template_path)
 
-    assert str(rte.value).startswith(expected_error)
+    assert str(rte.value).startswith(expected_error.format(path=str(template_path)))
+
+
+@pytest.mark.parametrize(
+    "tempfile_extension,file_contents",
+    [
+        pytest.param(".template.json", '["not", "a", "map"]', id="JSON list"),
+        pytest.param(".template.yaml", "- not\n- a\n- map\n", id="YAML list"),
+        pytest.param(".template.yaml", '"bad":\n"yaml"', id="Malformed YAML"),
+    ],
+)
+def test_read_template_not_a_mapping(tempfile_extension: str, file_contents: str, tmp_path: Path):
+    """
+    Tests that `read_template` raises a RuntimeError when the document is not a map
+    """
+    template_filename = tmp_path / f"test{tempfile_extension}"
+    template_filename.write_text(file_contents, encoding="utf8")
+
+    with pytest.raises(RuntimeError) as rte:
+        read_template(template_filename)
+
+    assert "consisting of key-value pairs" in str(rte.value)
 
 
 @pytest.mark.parametrize(
@@ -123,25 +178,20 @@ def test_read_template_fileerror(
         ),
     ],
 )
-def test_read_job_template_parsingerror(tempfile_extension: str, file_contents: str):
+def test_read_job_template_parsingerror(
+    tempfile_extension: str, file_contents: str, tmp_path: Path
+):
     """
     Tests that `read_job_template` raises a DecodeValidationError when provided a JSON/YAML body with schema errors
     """
-    temp_template = None
-
-    with tempfile.NamedTemporaryFile(
-        mode="w+t", suffix=tempfile_extension, encoding="utf8", delete=False
-    ) as temp_template:
-        temp_template.write(file_contents)
+    mock_args = tmp_path / f"test{tempfile_extension}"
+    mock_args.write_text(file_contents, encoding="utf8")
 
-    mock_args = Path(temp_template.name)
     with pytest.raises(DecodeValidationError) as re:
         read_job_template(mock_args)
 
     assert "validation errors for JobTemplate" in str(re.value)
 
-    Path(temp_template.name).unlink()
-
 
 @pytest.mark.parametrize(
     "tempfile_extension,file_contents",
@@ -158,31 +208,28 @@ def test_read_job_template_parsingerror(tempfile_extension: str, file_contents:
         ),
     ],
 )
-def test_read_environment_template_parsingerror(tempfile_extension: str, file_contents: str):
+def test_read_environment_template_parsingerror(
+    tempfile_extension: str, file_contents: str, tmp_path: Path
+):
     """
     Tests that `read_environment_template` raises a DecodeValidationError when provided a JSON/YAML body with schema errors
     """
-    temp_template = None
-
-    with tempfile.NamedTemporaryFile(
-        mode="w+t", suffix=tempfile_extension, encoding="utf8", delete=False
-    ) as temp_template:
-        temp_template.write(file_contents)
+    mock_args = tmp_path / f"test{tempfile_extension}"
+    mock_args.write_text(file_contents, encoding="utf8")
 
-    mock_args = Path(temp_template.name)
     with pytest.raises(DecodeValidationError) as re:
         read_environment_template(mock_args)
 
     assert "validation errors for EnvironmentTemplate" in str(re.value)
 
-    Path(temp_template.name).unlink()
-
 
 @pytest.mark.parametrize(
     "mock_param_args,expected_param_values",
     [
         pytest.param(MOCK_PARAM_ARGUMENTS, MOCK_PARAM_VALUES, id="Params from key-value pair"),
         pytest.param(["MyParam=One=Two"], {"MyParam": "One=Two"}, id="Param value with = in it"),
+        pytest.param(["MyParam="], {"MyParam": ""}, id="Param with empty value"),
+        pytest.param(["K=a\nb"], {"K": "a\nb"}, id="Param value with a newline in it"),
         pytest.param(["file://TEMPDIR/params.json"], MOCK_PARAM_VALUES, id="Params from file"),
         pytest.param(
             [json.dumps({"MyParam": "5"})], {"MyParam": "5"}, id="Params from json string"
@@ -192,6 +239,11 @@ def test_read_environment_template_parsingerror(tempfile_extension: str, file_co
             {"MyParam": "Value=5"},
             id="Params from json string",
         ),
+        pytest.param(
+            [json.dumps({"MyParam": "5"}, indent=4)],
+            {"MyParam": "5"},
+            id="Params from multi-line json string",
+        ),
         pytest.param(
             ["SomeParam=SomeValue", "file://TEMPDIR/params.json"],
             {"SomeParam": "SomeValue", "Title": "overwrite", "RequiredParam": "5"},
@@ -199,115 +251,117 @@ def test_read_environment_template_parsingerror(tempfile_extension: str, file_co
         ),
     ],
 )
-def test_get_job_params_success(mock_param_args: list[str], expected_param_values: dict):
+def test_get_job_params_success(
+    mock_param_args: list[str], expected_param_values: dict, tmp_path: Path
+):
     """
     Test that Job Parameters can be decoded from a string.
     """
+    param_files = [
+        tmp_path / arg.removeprefix("file://TEMPDIR/")
+        for arg in mock_param_args
+        if arg.startswith("file://TEMPDIR/")
+    ]
+    for param_file in param_files:
+        param_file.write_text(json.dumps(expected_param_values))
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        for i, file_arg in enumerate(mock_param_args):
-            if file_arg.startswith("file://TEMPDIR/"):
-                param_file = open(
-                    os.path.join(temp_dir, file_arg.removeprefix("file://TEMPDIR/")), "x"
-                )
-                json.dump(expected_param_values, param_file)
-                param_file.close()
-
-                mock_param_args[i] = file_arg.replace("TEMPDIR", temp_dir)
+    # Build a new list so that the parametrize list is not rewritten in place
+    param_args = [
+        arg.replace("TEMPDIR", str(tmp_path), 1) if arg.startswith("file://TEMPDIR/") else arg
+        for arg in mock_param_args
+    ]
 
-        params = get_job_params(mock_param_args)
-        assert params == expected_param_values
+    params = get_job_params(param_args)
+    assert params == expected_param_values
 
 
 @pytest.mark.parametrize(
-    "mock_param_args,mock_path_exists,mock_path_is_file,mock_expand_user,mock_read_effect,expected_error",
+    "param_arg,file_contents,is_directory,open_error,expected_error",
     [
         pytest.param(
-            ["bad format"],
-            False,
+            "bad format",
+            None,
             False,
-            "",
             None,
             "Job parameter string ('bad format') not formatted correctly.",
             id="Badly-formatted parameter string",
         ),
         pytest.param(
-            ["file://some-file.json"],
-            False,
+            "file://TEMPDIR/some-file.json",
+            None,
             False,
-            "some-file.json",
             None,
             "does not exist",
             id="Non-existent parameter filepath",
         ),
         pytest.param(
-            ["file://some-directory"],
+            "file://TEMPDIR/some-directory",
+            None,
             True,
-            False,
-            "some-directory",
             None,
             "is not a file",
             id="Parameter filepath is not a file",
         ),
         pytest.param(
-            ["file://some-image.png"],
-            True,
-            True,
-            "some-image.png",
+            "file://TEMPDIR/some-image.png",
+            b"",
+            False,
             None,
             "is not JSON or YAML",
             id="Parameter filepath is not JSON/YAML",
         ),
         pytest.param(
-            ["file://forbidden-file.json"],
-            True,
-            True,
-            "forbidden-file.json",
+            "file://TEMPDIR/forbidden-file.json",
+            b"{}",
+            False,
             OSError("some OS error"),
             "Could not open",
             id="Unable to open file",
         ),
         pytest.param(
-            ["file://bad-params.json"],
-            True,
-            True,
-            "bad-params.json",
-            lambda: "{bad json}",
+            "file://TEMPDIR/bad-params.json",
+            b"{bad json}",
+            False,
+            None,
             "is formatted incorrectly",
             id="Badly-formatted parameter file (JSON)",
         ),
         pytest.param(
-            ["file://bad-params.yaml"],
-            True,
-            True,
-            "bad-params.json",
-            lambda: '"bad":\n"yaml"',
+            "file://TEMPDIR/bad-params.yaml",
+            b'"bad":\n"yaml"',
+            False,
+            None,
             "is formatted incorrectly",
             id="Badly-formatted parameter file (YAML)",
         ),
         pytest.param(
-            ["file://list-file.json"],
-            True,
-            True,
-            "list-file.json",
-            lambda: '["not a dictionary"]',
+            "file://TEMPDIR/list-file.json",
+            b'["not a dictionary"]',
+            False,
+            None,
             "should contain a dictionary",
             id="Non-dictionary file contents",
         ),
         pytest.param(
-            ["- not json -"],
+            "=value",
+            None,
             False,
+            None,
+            "Job parameter string ('=value') not formatted correctly.",
+            id="Missing parameter name",
+        ),
+        pytest.param(
+            "- not json -",
+            None,
             False,
-            "",
             None,
             "Job parameter string ('- not json -') not formatted correctly.",
             id="Not JSON",
         ),
         pytest.param(
-            ['["a", "b"]'],
-            False,
+            '["a", "b"]',
+            None,
             False,
-            "",
             None,
             'Job parameter string (\'["a", "b"]\') not formatted correctly.',
             id="JSON not dictionary",
@@ -315,24 +369,35 @@ def test_get_job_params_success(mock_param_args: list[str], expected_param_value
     ],
 )
 def test_get_job_params_error(
-    mock_param_args: list[str],
-    mock_path_exists: bool,
-    mock_path_is_file: bool,
-    mock_expand_user: str,
-    mock_read_effect: Any,
+    param_arg: str,
+    file_contents: Optional[bytes],
+    is_directory: bool,
+    open_error: Optional[OSError],
     expected_error: str,
+    tmp_path: Path,
 ):
     """
     Test that errors thrown by `get_job_params` have expected information.
     """
-    with (
-        patch.object(Path, "exists", new=Mock(return_value=mock_path_exists)),
-        patch.object(Path, "is_file", new=Mock(return_value=mock_path_is_file)),
-        patch.object(Path, "expanduser", new=Mock(return_value=Path(mock_expand_user))),
-        patch.object(Path, "read_text", new=Mock(side_effect=mock_read_effect)),
-        pytest.raises(RuntimeError) as rte,
-    ):
-        get_job_params(mock_param_args)
+    if param_arg.startswith("file://TEMPDIR/"):
+        param_file = tmp_path / param_arg.removeprefix("file://TEMPDIR/")
+        param_arg = "file://" + str(param_file)
+        if is_directory:
+            param_file.mkdir()
+        elif file_contents is not None:
+            param_file.write_bytes(file_contents)
+
+    with ExitStack() as stack:
+        if open_error:
+            stack.enter_context(
+                patch(
+                    "openjd.cli._common._validation_utils.open",
+                    create=True,
+                    new=Mock(side_effect=open_error),
+                )
+            )
+        with pytest.raises(RuntimeError) as rte:
+            get_job_params([param_arg])
 
     assert expected_error in str(rte.value)
 
@@ -438,21 +503,16 @@ def test_job_from_template_error(
     ],
 )
 def test_generate_job_success(
-    template_dict: dict, param_list: list[str], expected_param_list: list
+    template_dict: dict, param_list: list[str], expected_param_list: list, tmp_path: Path
 ):
     """
     Test that a Namespace object can be used to generate a Job correctly.
     """
-    temp_template = None
+    template_file = tmp_path / "test.template.json"
+    template_file.write_text(json.dumps(template_dict), encoding="utf8")
 
-    with tempfile.NamedTemporaryFile(
-        mode="w+t", suffix=".template.json", encoding="utf8", delete=False
-    ) as temp_template:
-        json.dump(template_dict, temp_template.file)
-
-    mock_args = Namespace(
-        path=Path(temp_template.name), job_params=param_list, output="human-readable"
-    )
+    mock_args = Namespace(path=template_file, job_params=param_list, output="human-readable")
+    current_working_dir = Path(os.getcwd())
 
     # Patch `job_from_template` to "spy" on its call, ensuring that it
     # gets passed the right parameters
@@ -462,11 +522,9 @@ def test_generate_job_success(
     ) as patched_job_from_template:
         generate_job(mock_args)
         patched_job_from_template.assert_called_once_with(
-            ANY, expected_param_list, Path(temp_template.name).parent, Path(os.getcwd())
+            ANY, expected_param_list, tmp_path, current_working_dir
         )
 
-    Path(temp_template.name).unlink()
-
 
 @pytest.mark.parametrize(
     "template_dict, param_list, expected_error",
@@ -493,20 +551,53 @@ def test_generate_job_success(
     ],
 )
 def test_generate_job_raises(
-    template_dict: dict, param_list: list[str], expected_error: str
+    template_dict: dict, param_list: list[str], expected_error: str, tmp_path: Path
 ) -> None:
     """Test that generate_job() raises the expected exceptions."""
 
-    temp_template = None
+    template_file = tmp_path / "test.template.json"
+    template_file.write_text(json.dumps(template_dict), encoding="utf8")
 
-    with tempfile.NamedTemporaryFile(
-        mode="w+t", suffix=".template.json", encoding="utf8", delete=False
-    ) as temp_template:
-        json.dump(template_dict, temp_template.file)
-
-    args = Namespace(path=Path(temp_template.name), job_params=param_list, output="human-readable")
+    args = Namespace(path=template_file, job_params=param_list, output="human-readable")
 
     with pytest.raises(RuntimeError) as excinfo:
         generate_job(args)
 
     assert expected_error in str(excinfo.value)
+
+
+@dataclass
+class _NestedResult:
+    name: str
+    description: Optional[str]
+
+
+@dataclass
+class _SampleCliResult(OpenJDCliResult):
+    count: int
+    items: list[_NestedResult]
+    optional_items: Optional[list[_NestedResult]]
+
+
+def test_asdict_omit_null_matches_dataclasses_asdict():
+    """
+    Test that `_asdict_omit_null` gives the same result as `dataclasses.asdict` with
+    a dict_factory that drops empty fields, including for nested dataclasses.
+    """
+    result = _SampleCliResult(
+        status="success",
+        message="",
+        count=0,
+        items=[_NestedResult(name="a", description=None), _NestedResult(name="b", description="B")],
+        optional_items=None,
+    )
+
+    expected = asdict(
+        result, dict_factory=lambda attrs: {attr: value for (attr, value) in attrs if value}
+    )
+
+    assert _asdict_omit_null(result) == expected
+    assert _asdict_omit_null(result) == {
+        "status": "success",
+        "items": [{"name": "a"}, {"name": "b", "description": "B"}],
+    }
@@ -1,11 +1,14 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import logging
 import pytest
 from unittest.mock import call, patch
 import signal
+import threading
 
 from . import SampleSteps, SESSION_PARAMETERS
 from openjd.sessions import Session, SessionState
+from openjd.cli._run._local_session._logs import LocalSessionLogHandler
 from openjd.cli._run._local_session._session_manager import LocalSession
 import openjd.cli._run._local_session._session_manager as local_session_mod
 
@@ -90,6 +93,30 @@ def test_generate_task_parameter_set(
             )
 
 
+@pytest.mark.usefixtures("sample_job_and_dirs")
+def test_generate_task_parameter_set_all_provided(sample_job_and_dirs: tuple):
+    """
+    Test that the Step's default parameter set is not computed when every Task parameter is provided.
+    """
+    sample_job, template_dir, current_working_dir = sample_job_and_dirs
+    with (
+        LocalSession(job=sample_job, session_id="my-session") as session,
+        patch.object(local_session_mod, "StepParameterSpaceIterator") as patched_iterator,
+    ):
+        param_space = sample_job.steps[SampleSteps.TaskParamStep].parameterSpace
+        assert param_space is not None
+        parameter_set = session._generate_task_parameter_set(
+            parameter_space=param_space,
+            parameter_values={"TaskNumber": 5, "TaskMessage": "Hello!"},
+        )
+
+    patched_iterator.assert_not_called()
+    assert {name: param.value for name, param in parameter_set.items()} == {
+        "TaskNumber": "5",
+        "TaskMessage": "Hello!",
+    }
+
+
 @pytest.mark.usefixtures("sample_job_and_dirs")
 @pytest.mark.parametrize(*SESSION_PARAMETERS)
 def test_localsession_initialize(
@@ -127,7 +154,7 @@ def test_localsession_initialize(
 
         assert not session.ended.is_set()
         # We expect one entry in the Action queue per Task, and two per environment (Enter and Exit)
-        assert session._action_queue.qsize() == 2 * num_expected_environments + num_expected_tasks
+        assert len(session._action_queue) == 2 * num_expected_environments + num_expected_tasks
 
 
 @pytest.mark.usefixtures("sample_job_and_dirs")
@@ -137,6 +164,9 @@ def test_localsession_traps_sigint(sample_job_and_dirs: tuple):
 
     # GIVEN
     with patch.object(local_session_mod, "signal") as signal_mod:
+        # The previously installed handlers; None is returned for one not installed from Python
+        signal_mod.side_effect = [signal.default_int_handler, None, None, None]
+
         # WHEN
         with LocalSession(job=sample_job, session_id="test-id") as localsession:
             pass
@@ -147,12 +177,37 @@ def test_localsession_traps_sigint(sample_job_and_dirs: tuple):
         [
             call(signal.SIGINT, localsession._sigint_handler),
             call(signal.SIGTERM, localsession._sigint_handler),
-            call(signal.SIGINT, signal.SIG_DFL),
+            call(signal.SIGINT, signal.default_int_handler),
             call(signal.SIGTERM, signal.SIG_DFL),
         ]
     )
 
 
+@pytest.mark.usefixtures("sample_job_and_dirs")
+def test_localsession_skips_signals_off_main_thread(sample_job_and_dirs: tuple):
+    # Signal handlers can only be installed from the main thread
+    sample_job, template_dir, current_working_dir = sample_job_and_dirs
+    errors: list[BaseException] = []
+
+    def enter_session() -> None:
+        try:
+            with LocalSession(job=sample_job, session_id="test-id"):
+                pass
+        except BaseException as e:
+            errors.append(e)
+
+    # GIVEN
+    with patch.object(local_session_mod, "signal") as signal_mod:
+        # WHEN
+        thread = threading.Thread(target=enter_session)
+        thread.start()
+        thread.join()
+
+    # THEN
+    assert errors == []
+    signal_mod.assert_not_called()
+
+
 @pytest.mark.usefixtures("sample_job_and_dirs", "capsys")
 @pytest.mark.parametrize(*SESSION_PARAMETERS)
 def test_localsession_run_success(
@@ -207,6 +262,7 @@ def test_localsession_run_not_ready(sample_job_and_dirs: tuple):
             session.run()
 
     assert "not in a READY state" in str(rte.value)
+    assert session.get_duration() == 0
 
 
 @pytest.mark.usefixtures("sample_job_and_dirs", "capsys")
@@ -228,3 +284,18 @@ def test_localsession_run_failed(sample_job_and_dirs: tuple, capsys: pytest.Capt
     assert session.failed
     assert session._cleanup_called
     assert "Open Job Description CLI: ERROR" in capsys.readouterr().out
+
+
+def test_log_handlers_do_not_share_messages():
+    """
+    Test that each log handler records only the messages it handled itself.
+    """
+    first_handler = LocalSessionLogHandler(should_print=False)
+    second_handler = LocalSessionLogHandler(should_print=False)
+
+    first_handler.handle(
+        logging.LogRecord("test", logging.INFO, __file__, 0, "First message", None, None)
+    )
+
+    assert [entry.message for entry in first_handler.messages] == ["First message"]
+    assert second_handler.messages == []
@@ -3,20 +3,22 @@
 from argparse import Namespace
 import json
 from pathlib import Path, PureWindowsPath, PurePosixPath
-import tempfile
 import re
 import os
-from typing import Any, Optional
+import sys
+from typing import Any
 import logging
 
 import pytest
 from unittest.mock import Mock, patch
 
-from . import MOCK_TEMPLATE, SampleSteps
+from . import SampleSteps
 from openjd.cli._run._run_command import (
     OpenJDRunResult,
     do_run,
+    _collect_required_steps,
     _run_local_session,
+    _process_path_mapping_rules,
     _process_task_params,
     _process_tasks,
     _validate_task_params,
@@ -258,179 +260,157 @@ def test_do_run_success(
     expected_output: re.Pattern[str],
     expected_not_in_output: str,
     caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
 ) -> None:
     """Test that the 'run' command correctly runs templates and obtains the expected results."""
 
-    files_created: list[Path] = []
-    try:
-        # GIVEN
-        with tempfile.NamedTemporaryFile(
-            mode="w+t", suffix=".template.json", encoding="utf8", delete=False
-        ) as job_template_file:
-            json.dump(job_template, job_template_file.file)
-        files_created.append(Path(job_template_file.name))
-
-        environments_files: list[str] = []
-        for e in env_templates:
-            with tempfile.NamedTemporaryFile(
-                mode="w+t", suffix=".env.template.json", encoding="utf8", delete=False
-            ) as file:
-                json.dump(e, file.file)
-            files_created.append(Path(file.name))
-            environments_files.append(file.name)
-
-        args = Namespace(
-            path=Path(job_template_file.name),
-            step=step_name,
-            job_params=["J=Jvalue"],
-            task_params=task_params,
-            tasks=None,
-            maximum_tasks=-1,
-            run_dependencies=run_dependencies,
-            path_mapping_rules=None,
-            environments=environments_files,
-            output="human-readable",
-            verbose=False,
-            preserve=False,
-        )
+    # GIVEN
+    job_template_file = tmp_path / "job.template.json"
+    job_template_file.write_text(json.dumps(job_template), encoding="utf8")
+
+    environments_files: list[str] = []
+    for i, e in enumerate(env_templates):
+        env_file = tmp_path / f"env{i}.env.template.json"
+        env_file.write_text(json.dumps(e), encoding="utf8")
+        environments_files.append(str(env_file))
+
+    args = Namespace(
+        path=job_template_file,
+        step=step_name,
+        job_params=["J=Jvalue"],
+        task_params=task_params,
+        tasks=None,
+        maximum_tasks=-1,
+        run_dependencies=run_dependencies,
+        path_mapping_rules=None,
+        environments=environments_files,
+        output="human-readable",
+        verbose=False,
+        preserve=False,
+    )
 
-        # WHEN
-        do_run(args)
+    # WHEN
+    do_run(args)
 
-        # THEN
-        assert not any(
-            os.linesep in m for m in caplog.messages
-        ), "paranoia; Windows is acting weird"
-        assert expected_output.search("".join(m.strip() for m in caplog.messages))
-        if expected_not_in_output:
-            assert expected_not_in_output not in caplog.text
-    finally:
-        for f in files_created:
-            f.unlink()
+    # THEN
+    assert not any(os.linesep in m for m in caplog.messages), "paranoia; Windows is acting weird"
+    assert expected_output.search("".join(m.strip() for m in caplog.messages))
+    if expected_not_in_output:
+        assert expected_not_in_output not in caplog.text
 
 
 def test_preserve_option(
     caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
 ) -> None:
     """Test that the 'run' command preserves the session working directory when asked to."""
 
-    files_created: list[Path] = []
-    try:
-        # GIVEN
-        with tempfile.NamedTemporaryFile(
-            mode="w+t", suffix=".template.json", encoding="utf8", delete=False
-        ) as job_template_file:
-            json.dump(
-                {
-                    "name": "TestJob",
-                    "specificationVersion": "jobtemplate-2023-09",
-                    "steps": [
-                        {
-                            "name": "TestStep",
-                            "script": {
-                                "actions": {
-                                    "onRun": {
-                                        "command": "python",
-                                        "args": ["-c", "print('Hello World')"],
-                                    }
+    # GIVEN
+    job_template_file = tmp_path / "job.template.json"
+    job_template_file.write_text(
+        json.dumps(
+            {
+                "name": "TestJob",
+                "specificationVersion": "jobtemplate-2023-09",
+                "steps": [
+                    {
+                        "name": "TestStep",
+                        "script": {
+                            "actions": {
+                                "onRun": {
+                                    "command": "python",
+                                    "args": ["-c", "print('Hello World')"],
                                 }
-                            },
-                        }
-                    ],
-                },
-                job_template_file.file,
-            )
-        files_created.append(Path(job_template_file.name))
-
-        args = Namespace(
-            path=Path(job_template_file.name),
-            step="TestStep",
-            job_params=[],
-            task_params=None,
-            tasks=None,
-            maximum_tasks=-1,
-            run_dependencies=False,
-            path_mapping_rules=None,
-            environments=[],
-            output="human-readable",
-            verbose=False,
-            preserve=True,
-        )
+                            }
+                        },
+                    }
+                ],
+            }
+        ),
+        encoding="utf8",
+    )
 
-        # WHEN
-        result = do_run(args)
+    args = Namespace(
+        path=job_template_file,
+        step="TestStep",
+        job_params=[],
+        task_params=None,
+        tasks=None,
+        maximum_tasks=-1,
+        run_dependencies=False,
+        path_mapping_rules=None,
+        environments=[],
+        output="human-readable",
+        verbose=False,
+        preserve=True,
+    )
 
-        # THEN
-        assert "Working directory preserved at" in result.message
-        # Extract the working directory from the output
-        match = re.search("Working directory preserved at: (.+)", result.message)
-        assert match is not None
-        dir = match[1]
-        assert Path(dir).exists()
-    finally:
-        for f in files_created:
-            f.unlink()
+    # WHEN
+    result = do_run(args)
+
+    # THEN
+    assert "Working directory preserved at" in result.message
+    # Extract the working directory from the output
+    match = re.search("Working directory preserved at: (.+)", result.message)
+    assert match is not None
+    dir = match[1]
+    assert Path(dir).exists()
 
 
 def test_verbose_option(
     caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
 ) -> None:
     """Test that the verbose option has set the log level of the openjd-sessions library to DEBUG."""
 
-    files_created: list[Path] = []
-    try:
-        # GIVEN
-        with tempfile.NamedTemporaryFile(
-            mode="w+t", suffix=".template.json", encoding="utf8", delete=False
-        ) as job_template_file:
-            json.dump(
-                {
-                    "name": "TestJob",
-                    "specificationVersion": "jobtemplate-2023-09",
-                    "steps": [
-                        {
-                            "name": "TestStep",
-                            "script": {
-                                "actions": {
-                                    "onRun": {
-                                        "command": "python",
-                                        "args": ["-c", "print('Hello World')"],
-                                    }
+    # GIVEN
+    job_template_file = tmp_path / "job.template.json"
+    job_template_file.write_text(
+        json.dumps(
+            {
+                "name": "TestJob",
+                "specificationVersion": "jobtemplate-2023-09",
+                "steps": [
+                    {
+                        "name": "TestStep",
+                        "script": {
+                            "actions": {
+                                "onRun": {
+                                    "command": "python",
+                                    "args": ["-c", "print('Hello World')"],
                                 }
-                            },
-                        }
-                    ],
-                },
-                job_template_file.file,
-            )
-        files_created.append(Path(job_template_file.name))
-
-        args = Namespace(
-            path=Path(job_template_file.name),
-            step="TestStep",
-            job_params=[],
-            task_params=None,
-            tasks=None,
-            maximum_tasks=-1,
-            run_dependencies=False,
-            path_mapping_rules=None,
-            environments=[],
-            output="human-readable",
-            verbose=True,
-            preserve=False,
-        )
+                            }
+                        },
+                    }
+                ],
+            }
+        ),
+        encoding="utf8",
+    )
 
-        # WHEN
-        do_run(args)
+    args = Namespace(
+        path=job_template_file,
+        step="TestStep",
+        job_params=[],
+        task_params=None,
+        tasks=None,
+        maximum_tasks=-1,
+        run_dependencies=False,
+        path_mapping_rules=None,
+        environments=[],
+        output="human-readable",
+        verbose=True,
+        preserve=False,
+    )
 
-        # THEN
-        assert SessionsLogger.isEnabledFor(logging.DEBUG)
+    # WHEN
+    do_run(args)
 
-        # Reset the state to not interfere with other tests.
-        SessionsLogger.setLevel(logging.INFO)
-    finally:
-        for f in files_created:
-            f.unlink()
+    # THEN
+    assert SessionsLogger.isEnabledFor(logging.DEBUG)
+
+    # Reset the state to not interfere with other tests.
+    SessionsLogger.setLevel(logging.INFO)
 
 
 def test_do_run_error():
@@ -453,7 +433,7 @@ def test_do_run_error():
         do_run(mock_args)
 
 
-def test_do_run_path_mapping_rules(caplog: pytest.LogCaptureFixture):
+def test_do_run_path_mapping_rules(caplog: pytest.LogCaptureFixture, tmp_path: Path):
     """
     Test that the `run` command exits on any error (e.g., a non-existent template file).
     """
@@ -487,67 +467,80 @@ def test_do_run_path_mapping_rules(caplog: pytest.LogCaptureFixture):
         ],
     }
 
-    try:
-        # Set up a rules file and a job template file
-        temp_rules = temp_template = None
-        with tempfile.NamedTemporaryFile(
-            mode="w+t", suffix=".rules.json", encoding="utf8", delete=False
-        ) as temp_rules:
-            json.dump(path_mapping_rules, temp_rules.file)
-
-        with tempfile.NamedTemporaryFile(
-            mode="w+t", suffix=".template.json", encoding="utf8", delete=False
-        ) as temp_template:
-            json.dump(job_template, temp_template.file)
-
-        run_args = Namespace(
-            path=Path(temp_template.name),
-            step="TestStep",
-            job_params=[r"TestPath=/home/test" if os.name == "posix" else r"TestPath=c:\test"],
-            task_params=None,
-            tasks=None,
-            run_dependencies=False,
-            output="human-readable",
-            path_mapping_rules="file://" + temp_rules.name,
-            environments=[],
-            maximum_tasks=1,
-            verbose=False,
-            preserve=False,
-        )
+    # Set up a rules file and a job template file
+    temp_rules = tmp_path / "path.rules.json"
+    temp_rules.write_text(json.dumps(path_mapping_rules), encoding="utf8")
 
-        # WHEN
-        do_run(run_args)
+    temp_template = tmp_path / "job.template.json"
+    temp_template.write_text(json.dumps(job_template), encoding="utf8")
 
-        # THEN
-        assert not any(
-            os.linesep in m for m in caplog.messages
-        ), "paranoia; Windows is acting weird."
-        if os.name == "posix":
-            assert any("Mapped:/mnt/test" in m for m in caplog.messages)
-        else:
-            assert any(r"Mapped:\mnt\test" in m for m in caplog.messages)
-    finally:
-        if temp_rules:
-            Path(temp_rules.name).unlink()
-        if temp_template:
-            Path(temp_template.name).unlink()
+    run_args = Namespace(
+        path=temp_template,
+        step="TestStep",
+        job_params=[r"TestPath=/home/test" if os.name == "posix" else r"TestPath=c:\test"],
+        task_params=None,
+        tasks=None,
+        run_dependencies=False,
+        output="human-readable",
+        path_mapping_rules="file://" + str(temp_rules),
+        environments=[],
+        maximum_tasks=1,
+        verbose=False,
+        preserve=False,
+    )
+
+    # WHEN
+    do_run(run_args)
+
+    # THEN
+    assert not any(os.linesep in m for m in caplog.messages), "paranoia; Windows is acting weird."
+    if os.name == "posix":
+        assert any("Mapped:/mnt/test" in m for m in caplog.messages)
+    else:
+        assert any(r"Mapped:\mnt\test" in m for m in caplog.messages)
 
 
 @pytest.mark.usefixtures("capsys")
-def test_do_run_nonexistent_step(capsys: pytest.CaptureFixture):
+@pytest.mark.parametrize(
+    "argument,expected_error",
+    [
+        pytest.param("not json", "must be a JSON document", id="Not JSON"),
+        pytest.param(
+            "file://does-not-exist.json",
+            "Could not open path mapping rules file",
+            id="Nonexistent file",
+        ),
+        pytest.param(
+            '[{"source_path": "/home/test"}]',
+            "must have a 'version' value of 'pathmapping-1.0'",
+            id="Not a mapping",
+        ),
+        pytest.param(
+            '{"version": "pathmapping-1.0", "path_mapping_rules": {}}',
+            "must contain a list named 'path_mapping_rules'",
+            id="Rules not a list",
+        ),
+    ],
+)
+def test_process_path_mapping_rules_error(argument: str, expected_error: str):
     """
-    Test that invoking the `run` command with an incorrect Step name produces the right output.
-    (This doesn't actually raise an error, so we have to test the output by capturing `stdout`.)
+    Test that malformed --path-mapping-rules arguments are reported as errors.
     """
-    temp_template = None
+    with pytest.raises(RuntimeError) as rte:
+        _process_path_mapping_rules(argument)
 
-    with tempfile.NamedTemporaryFile(
-        mode="w+t", suffix=".template.json", encoding="utf8", delete=False
-    ) as temp_template:
-        json.dump(MOCK_TEMPLATE, temp_template.file)
+    assert expected_error in str(rte.value)
 
+
+def test_do_run_nonexistent_step(
+    capsys: pytest.CaptureFixture, mock_template_files: dict[str, Path]
+):
+    """
+    Test that invoking the `run` command with an incorrect Step name produces the right output.
+    (This doesn't actually raise an error, so we have to test the output by capturing `stdout`.)
+    """
     mock_args = Namespace(
-        path=Path(temp_template.name),
+        path=mock_template_files[".template.json"],
         step="FakeStep",
         job_params=None,
         task_params=None,
@@ -567,12 +560,8 @@ def test_do_run_nonexistent_step(capsys: pytest.CaptureFixture):
         in capsys.readouterr().out
     )
 
-    Path(temp_template.name).unlink()
 
-
-@pytest.mark.usefixtures(
-    "sample_job_and_dirs", "sample_step_map", "patched_session_cleanup", "capsys"
-)
+@pytest.mark.usefixtures("sample_job_and_dirs", "patched_session_cleanup", "capsys")
 @pytest.mark.parametrize(
     "step_index,dependency_indexes,should_run_dependencies",
     [
@@ -612,7 +601,6 @@ def test_do_run_nonexistent_step(capsys: pytest.CaptureFixture):
 )
 def test_run_local_session_success(
     sample_job_and_dirs: tuple,
-    sample_step_map: dict,
     patched_session_cleanup: Mock,
     capsys: pytest.CaptureFixture,
     step_index: int,
@@ -643,7 +631,6 @@ def test_run_local_session_success(
     ):
         response = _run_local_session(
             job=sample_job,
-            step_map=sample_step_map,
             step=sample_job.steps[step_index],
             path_mapping_rules=path_mapping_rules,
             should_run_dependencies=should_run_dependencies,
@@ -662,7 +649,7 @@ def test_run_local_session_success(
     patched_session_cleanup.assert_called()
 
 
-@pytest.mark.usefixtures("sample_job_and_dirs", "sample_step_map")
+@pytest.mark.usefixtures("sample_job_and_dirs")
 @pytest.mark.parametrize(
     "step_index,should_run_dependencies,expected_error",
     [
@@ -679,7 +666,6 @@ def test_run_local_session_success(
 )
 def test_run_local_session_failed(
     sample_job_and_dirs: tuple,
-    sample_step_map: dict,
     step_index: int,
     should_run_dependencies: bool,
     expected_error: str,
@@ -690,7 +676,6 @@ def test_run_local_session_failed(
     sample_job, template_dir, current_working_dir = sample_job_and_dirs
     response = _run_local_session(
         job=sample_job,
-        step_map=sample_step_map,
         step=sample_job.steps[step_index],
         path_mapping_rules=[],
         should_run_dependencies=should_run_dependencies,
@@ -700,6 +685,66 @@ def test_run_local_session_failed(
     assert expected_error in response.message
 
 
+def _mock_step(name: str, depends_on: list[str]) -> Mock:
+    step = Mock(stepEnvironments=None, dependencies=[Mock(dependsOn=d) for d in depends_on])
+    step.name = name
+    return step
+
+
+def test_collect_required_steps_diamond():
+    """
+    Test that a Step shared by several dependency paths is only collected once,
+    after all of its own dependencies.
+    """
+    step_map = {
+        "Root": _mock_step("Root", []),
+        "Left": _mock_step("Left", ["Root"]),
+        "Right": _mock_step("Right", ["Root"]),
+        "Leaf": _mock_step("Leaf", ["Left", "Right"]),
+    }
+
+    required_steps = _collect_required_steps(step_map, step_map["Leaf"])
+
+    assert [step.name for step in required_steps] == ["Root", "Left", "Right", "Leaf"]
+
+
+def test_collect_required_steps_long_chain():
+    """
+    Test that a dependency chain longer than the recursion limit can be collected.
+    """
+    names = [f"Step{i}" for i in range(sys.getrecursionlimit() + 100)]
+    step_map = {name: _mock_step(name, names[i - 1 : i]) for i, name in enumerate(names)}
+
+    required_steps = _collect_required_steps(step_map, step_map[names[-1]])
+
+    assert [step.name for step in required_steps] == names
+
+
+@pytest.mark.parametrize(
+    "step_map,expected_error",
+    [
+        pytest.param(
+            {"A": _mock_step("A", ["B"]), "B": _mock_step("B", ["A"])},
+            "circular dependency: A -> B -> A",
+            id="Dependency cycle",
+        ),
+        pytest.param(
+            {"A": _mock_step("A", ["Missing"])},
+            "Dependency 'Missing' in Step 'A' is not an existing Step.",
+            id="Missing dependency",
+        ),
+    ],
+)
+def test_collect_required_steps_error(step_map: dict, expected_error: str):
+    """
+    Test that invalid dependency graphs are reported rather than traversed.
+    """
+    with pytest.raises(RuntimeError) as rte:
+        _collect_required_steps(step_map, step_map["A"])
+
+    assert expected_error in str(rte.value)
+
+
 class TestProcessTaskParams:
     """Testing that we properly handle the values of the --task-param/-tp
     command-line argument"""
@@ -729,6 +774,10 @@ class TestProcessTaskParams:
             pytest.param(
                 ["Foo1"], "Task parameter 'Foo1' defined incorrectly.", id="regex mismatch"
             ),
+            pytest.param(["=1"], "Task parameter '=1' defined incorrectly.", id="missing name"),
+            pytest.param(
+                ["Foo="], "Task parameter 'Foo=' defined incorrectly.", id="missing value"
+            ),
             pytest.param(
                 ["Foo=1", "Foo=2"],
                 "Task parameter 'Foo' has been defined more than once.",
@@ -746,110 +795,116 @@ class TestProcessTasks:
     """Testing that we properly handle the value of the --tasks command-line argument."""
 
     @pytest.mark.parametrize(
-        "given, file_contents, expected",
+        "given, expected",
         [
             pytest.param(
-                "file://TEMPDIR/some-file.json",
                 '[{"Param1": "A", "Param2": 1}]',
                 [{"Param1": "A", "Param2": "1"}],
-                id="json file; one task",
-            ),
-            pytest.param(
-                "file://TEMPDIR/some-file.yaml",
-                '- Param1: "A"\n  Param2: 1\n',
-                [{"Param1": "A", "Param2": "1"}],
-                id="yaml file",
+                id="inline json; one task",
             ),
             pytest.param(
-                "file://TEMPDIR/some-file.json",
                 '[{"Param1": "A", "Param2": 1},{"Param1": "B", "Param2": 2}]',
                 [{"Param1": "A", "Param2": "1"}, {"Param1": "B", "Param2": "2"}],
-                id="json file; two tasks",
+                id="inline json; two tasks",
             ),
+            pytest.param('[{"Param": "A"}]', [{"Param": "A"}], id="param value str->str"),
+            pytest.param('[{"Param": 12}]', [{"Param": "12"}], id="param value int->str"),
+            pytest.param('[{"Param": 12.2}]', [{"Param": "12.2"}], id="param value float->str"),
+        ],
+    )
+    def test_success(self, given: str, expected: list[dict[str, str]]) -> None:
+        # WHEN
+        result = _process_tasks(given)
+
+        # THEN
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "filename, file_contents, expected",
+        [
             pytest.param(
+                "some-file.json",
                 '[{"Param1": "A", "Param2": 1}]',
-                None,
                 [{"Param1": "A", "Param2": "1"}],
-                id="inline json; one task",
+                id="json file; one task",
             ),
             pytest.param(
-                '[{"Param1": "A", "Param2": 1},{"Param1": "B", "Param2": 2}]',
-                None,
-                [{"Param1": "A", "Param2": "1"}, {"Param1": "B", "Param2": "2"}],
-                id="inline json; two tasks",
+                "some-file.yaml",
+                '- Param1: "A"\n  Param2: 1\n',
+                [{"Param1": "A", "Param2": "1"}],
+                id="yaml file",
             ),
-            pytest.param('[{"Param": "A"}]', None, [{"Param": "A"}], id="param value str->str"),
-            pytest.param('[{"Param": 12}]', None, [{"Param": "12"}], id="param value int->str"),
             pytest.param(
-                '[{"Param": 12.2}]', None, [{"Param": "12.2"}], id="param value float->str"
+                "some-file.json",
+                '[{"Param1": "A", "Param2": 1},{"Param1": "B", "Param2": 2}]',
+                [{"Param1": "A", "Param2": "1"}, {"Param1": "B", "Param2": "2"}],
+                id="json file; two tasks",
             ),
         ],
     )
-    def test_success(
-        self, given: str, file_contents: Optional[str], expected: dict[str, str]
+    def test_file_success(
+        self, filename: str, file_contents: str, expected: list[dict[str, str]], tmp_path: Path
     ) -> None:
         # GIVEN
-        with tempfile.TemporaryDirectory() as temp_dir:
-            if given.startswith("file://TEMPDIR"):
-                assert file_contents is not None
-                filename = os.path.join(temp_dir, given.removeprefix("file://TEMPDIR/"))
-                with open(filename, "w") as param_file:
-                    param_file.write(file_contents)
-                given = "file://" + filename
+        param_file = tmp_path / filename
+        param_file.write_text(file_contents)
 
-            # WHEN
-            result = _process_tasks(given)
+        # WHEN
+        result = _process_tasks("file://" + str(param_file))
 
-            # THEN
-            assert result == expected
+        # THEN
+        assert result == expected
 
     @pytest.mark.parametrize(
-        "given, file_contents, expected_error",
+        "given, expected_error",
         [
-            pytest.param(
-                "file://TEMPDIR/some-file.json",
-                "}not json",
-                "Parameter file.+is formatted incorrectly",
-                id="not json",
-            ),
-            pytest.param(
-                "file://TEMPDIR/some-file.yaml",
-                "}not yaml",
-                "Parameter file.+is formatted incorrectly",
-                id="not yaml",
-            ),
             pytest.param(
                 '{"Param": "A"}',
-                None,
                 "argument must be a list of maps from string to string when decoded",
                 id="not a list",
             ),
             pytest.param(
                 "[1,2,3]",
-                None,
                 "argument must be a list of maps from string to string when decoded",
                 id="not a list of dicts",
             ),
             pytest.param(
                 '[{"Param": [1,2]}]',
-                None,
                 "argument must be a list of maps from string to string when decoded",
                 id="value not scalar",
             ),
         ],
     )
-    def test_error(self, given: str, file_contents: Optional[str], expected_error: str) -> None:
+    def test_error(self, given: str, expected_error: str) -> None:
+        with pytest.raises(RuntimeError, match=expected_error):
+            _process_tasks(given)
+
+    @pytest.mark.parametrize(
+        "filename, file_contents, expected_error",
+        [
+            pytest.param(
+                "some-file.json",
+                "}not json",
+                "Parameter file.+is formatted incorrectly",
+                id="not json",
+            ),
+            pytest.param(
+                "some-file.yaml",
+                "}not yaml",
+                "Parameter file.+is formatted incorrectly",
+                id="not yaml",
+            ),
+        ],
+    )
+    def test_file_error(
+        self, filename: str, file_contents: str, expected_error: str, tmp_path: Path
+    ) -> None:
         # GIVEN
-        with tempfile.TemporaryDirectory() as temp_dir:
-            if given.startswith("file://TEMPDIR"):
-                assert file_contents is not None
-                filename = os.path.join(temp_dir, given.removeprefix("file://TEMPDIR/"))
-                with open(filename, "w") as param_file:
-                    param_file.write(file_contents)
-                given = "file://" + filename
-
-            with pytest.raises(RuntimeError, match=expected_error):
-                _process_tasks(given)
+        param_file = tmp_path / filename
+        param_file.write_text(file_contents)
+
+        with pytest.raises(RuntimeError, match=expected_error):
+            _process_tasks("file://" + str(param_file))
 
 
 class TestValidateTaskParams:
@@ -1,6 +1,6 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
-from openjd.cli._schema._schema_command import do_get_schema, _process_regex
+from openjd.cli._schema._schema_command import do_get_schema, _generate_schema, _process_regex
 from openjd.model import TemplateSpecificationVersion
 from pydantic import BaseModel
 
@@ -10,6 +10,14 @@ import pytest
 from unittest.mock import Mock, patch
 
 
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    """
+    Generated schemas are cached per process; start each test without them.
+    """
+    _generate_schema.cache_clear()
+
+
 @pytest.mark.parametrize(
     "target,expected_result",
     [
@@ -34,6 +42,11 @@ from unittest.mock import Mock, patch
             },
             id="Patterns in multiple levels",
         ),
+        pytest.param(
+            {"anyOf": [{"pattern": r"(?-m:^\w+\Z)"}, {"type": "integer"}]},
+            {"anyOf": [{"pattern": r"(?:^\w+$)"}, {"type": "integer"}]},
+            id="Pattern in list of dictionaries",
+        ),
         pytest.param(
             {"pattern": "NotRealRegex"}, {"pattern": "NotRealRegex"}, id="Unaffected pattern"
         ),
@@ -141,3 +154,31 @@ def test_do_get_schema_error(capsys: pytest.CaptureFixture):
     output = capsys.readouterr().out
 
     assert "Test error" in output
+
+
+def test_do_get_schema_cached(capsys: pytest.CaptureFixture):
+    """
+    Test that the schema for a version is only generated once and reused afterwards.
+    """
+    args = Namespace(
+        version=TemplateSpecificationVersion.JOBTEMPLATE_v2023_09.value, output="human-readable"
+    )
+    do_get_schema(args)
+    first_output = capsys.readouterr().out
+    do_get_schema(args)
+
+    assert capsys.readouterr().out == first_output
+    assert _generate_schema.cache_info().misses == 1
+    assert _generate_schema.cache_info().hits == 1
+
+
+def test_do_get_schema_leaves_model_schema_unchanged():
+    """
+    Test that translating the regex in the schema doesn't modify the schema
+    that Pydantic has cached for the model.
+    """
+    from openjd.model.v2023_09 import JobTemplate
+
+    _generate_schema(JobTemplate)
+
+    assert '"pattern": "(?-m:' in json.dumps(JobTemplate.schema())
@@ -6,7 +6,6 @@ from unittest.mock import Mock, patch
 from typing import Optional
 import json
 import pytest
-import tempfile
 
 from . import MOCK_TEMPLATE, MOCK_TEMPLATE_REQUIRES_PARAMS
 from openjd.cli._summary._summary_command import do_summary
@@ -48,27 +47,22 @@ def test_do_summary_success(
     mock_params: Optional[list[str]],
     mock_step: Optional[str],
     template: dict,
+    tmp_path: Path,
 ):
     """
     Test that the `summary` command succeeds with various argument options.
     """
-    temp_template = None
-
-    with tempfile.NamedTemporaryFile(
-        mode="w+t", suffix=".template.json", encoding="utf8", delete=False
-    ) as temp_template:
-        json.dump(template, temp_template.file)
+    template_file = tmp_path / "test.template.json"
+    template_file.write_text(json.dumps(template), encoding="utf8")
 
     mock_args = Namespace(
-        path=Path(temp_template.name),
+        path=template_file,
         job_params=mock_params,
         step=mock_step,
         output="human-readable",
     )
     do_summary(mock_args)
 
-    Path(temp_template.name).unlink()
-
 
 def test_do_summary_error():
     """